@@ -0,0 +1,115 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled row-mode WHERE filter and SELECT projection.
+
+Used by query_executor for lists of dictionaries when the extension has
+been built (python setup.py build_ext --inplace). The results and errors
+match the pure Python loops in query_executor.
+"""
+
+from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
+from cpython.object cimport (
+    PyObject, PyObject_RichCompareBool, Py_EQ, Py_NE, Py_GT, Py_LT, Py_GE, Py_LE
+)
+
+
+# Rich comparison opcode for each op_code, in query_executor._OP_CODES order
+cdef int[6] _COMPARE_OPS = [Py_EQ, Py_NE, Py_GT, Py_LT, Py_GE, Py_LE]
+
+
+cdef inline object _coerce(object row_val, object val):
+    """Coerce a row value like query_executor._coerce_value."""
+    
+    if type(row_val) is type(val):
+        return row_val
+    
+    if isinstance(val, str):
+        return str(row_val)
+    
+    if isinstance(val, (int, float)):
+        try:
+            if isinstance(val, float):
+                return float(row_val)
+            if '.' in str(row_val):
+                return float(row_val)
+            return int(row_val)
+        except (ValueError, TypeError):
+            raise ValueError(f"Cannot convert '{row_val}' to number")
+    
+    return row_val
+
+
+def filter_rows(list rows, str col, int op_code, object val):
+    """
+    Keep the rows whose value in col compares true against val.
+    
+    Args:
+        rows: List of row dictionaries (dict, not other mappings)
+        col: Column compared
+        op_code: Index of the operator (=, !=, >, <, >=, <=)
+        val: Value compared against
+        
+    Returns:
+        New list of the matching rows
+        
+    Raises:
+        TypeError: If a row is not a dict
+        KeyError: If a row has no value for col
+        ValueError: If a row value cannot be coerced to the type of val
+    """
+    
+    if op_code < 0 or op_code > 5:
+        raise ValueError(f"Unknown op_code: {op_code}")
+    
+    cdef int compare_op = _COMPARE_OPS[op_code]
+    cdef list out = []
+    cdef PyObject *item
+    cdef dict row
+    
+    for row in rows:
+        if row is None:
+            raise TypeError("rows must be dicts, not None")
+        item = PyDict_GetItem(row, col)
+        if item is NULL:
+            raise KeyError(col)
+        
+        if PyObject_RichCompareBool(_coerce(<object>item, val), val, compare_op):
+            out.append(row)
+    
+    return out
+
+
+def project_rows(list rows, tuple cols):
+    """
+    Build a dictionary holding only cols for each row.
+    
+    Args:
+        rows: List of row dictionaries (dict, not other mappings)
+        cols: Columns kept, in output order
+        
+    Returns:
+        New list of projected rows
+        
+    Raises:
+        TypeError: If a row is not a dict
+        KeyError: If a row has no value for one of cols
+    """
+    
+    cdef list out = []
+    cdef dict projected
+    cdef PyObject *item
+    cdef dict row
+    cdef object col
+    
+    for row in rows:
+        if row is None:
+            raise TypeError("rows must be dicts, not None")
+        projected = {}
+        for col in cols:
+            item = PyDict_GetItem(row, col)
+            if item is NULL:
+                raise KeyError(col)
+            PyDict_SetItem(projected, col, <object>item)
+        out.append(projected)
+    
+    return out
@@ -3,24 +3,453 @@ Module for loading CSV data into an in-memory data structure.
 """
 
 import csv
+import io
+import json
+import mmap
+import multiprocessing
+import os
+import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 
-def load_csv(file_path: str) -> tuple[List[Dict[str, Any]], str]:
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Number of non-empty values inspected when guessing a column's type
+TYPE_SAMPLE_SIZE = 100
+
+# Column types from most to least specific
+_TYPE_ORDER = [int, float, str]
+
+# Values accepted as numbers. Every reader types columns with these
+# patterns, so a file gets the same schema however it is loaded; Python's
+# int() and float() would also accept e.g. ' 42 ', '1_000' and 'nan'.
+# Integers must be written as str() writes them, so values such as '007'
+# or '+5' keep their column as text instead of being shown as 7 or 5.
+_INT_PATTERN = r'0|-?[1-9][0-9]*'
+_FLOAT_PATTERN = (
+    _INT_PATTERN
+    + r'|[+-]?([0-9]+\.[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?'
+    + r'|[+-]?[0-9]+[eE][+-]?[0-9]+'
+)
+_INT_RE = re.compile(_INT_PATTERN)
+_FLOAT_RE = re.compile(_FLOAT_PATTERN)
+
+# An integer column with missing values is stored as float64 so the gaps
+# can be NaN, which only holds integers up to this size exactly
+_MAX_EXACT_INT = 2 ** 53
+
+# Block size used by the pyarrow CSV reader
+ARROW_BLOCK_SIZE = 1 << 20
+
+# Read buffer size used by the csv module reader
+CSV_BUFFER_SIZE = 1 << 20
+
+
+# CSV files smaller than this are parsed serially by load_csv_parallel,
+# since starting worker processes costs more than it saves
+PARALLEL_MIN_BYTES = 10 * 1024 * 1024
+
+
+# Column types by name, as stored in the cache metadata
+_SCHEMA_TYPES = {'int': int, 'float': float, 'str': str}
+
+# CSV files larger than this are cached on disk when caching is enabled
+CACHE_MIN_BYTES = 10 * 1024 * 1024
+
+# Suffix appended to the CSV path to name its cache directory
+CACHE_SUFFIX = '.cache'
+
+# Bumped whenever the cache layout or column typing changes
+_CACHE_VERSION = 4
+
+# Text columns longer than this are dictionary-encoded when they have few
+# distinct values
+CATEGORICAL_MIN_ROWS = 1000
+
+# Maximum ratio of distinct values to rows for dictionary encoding
+CATEGORICAL_MAX_RATIO = 0.5
+
+
+class CategoricalColumn:
     """
-    Load data from a CSV file into a list of dictionaries.
+    Dictionary-encoded text column.
+    
+    Stores one int32 code per row indexing into a sorted array of the
+    distinct values. Comparisons against a value can then run on the
+    integer codes, and repeated strings are stored only once.
+    
+    Attributes:
+        codes: int32 array with the category position of each row
+        categories: Sorted object array of distinct values
+    """
+    
+    # Behaves like an object array of strings when decoded
+    dtype = np.dtype(object)
+    
+    def __init__(self, codes: np.ndarray, categories: np.ndarray):
+        """
+        Initialize the column.
+        
+        Args:
+            codes: int32 array with the category position of each row
+            categories: Sorted object array of distinct values
+        """
+        self.codes = codes
+        self.categories = categories
+    
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.codes)
+    
+    def __getitem__(self, key: Any) -> 'CategoricalColumn':
+        """
+        Select rows by boolean mask, slice or index array.
+        
+        Args:
+            key: Row selector accepted by NumPy indexing
+            
+        Returns:
+            New CategoricalColumn sharing the categories
+        """
+        return CategoricalColumn(self.codes[key], self.categories)
+    
+    def decode(self) -> np.ndarray:
+        """Return the values as an object array of strings."""
+        return self.categories[self.codes]
+    
+    def tolist(self) -> List[str]:
+        """Return the values as a list of strings."""
+        return self.decode().tolist()
+
+
+class ColumnarTable:
+    """
+    Column-oriented in-memory table.
+    
+    Each column is stored as a single typed array instead of one value per
+    row dictionary, so filters and aggregates can run as vectorized NumPy
+    operations.
+    
+    Attributes:
+        columns: Mapping of column name to array of values (low-cardinality
+            text columns are stored as CategoricalColumn)
+        row_count: Number of rows in the table
+        schema: Mapping of column name to Python type (int, float or str)
+    """
+    
+    def __init__(
+        self,
+        columns: Dict[str, Union[np.ndarray, CategoricalColumn]],
+        row_count: int,
+        schema: Dict[str, type]
+    ):
+        """
+        Initialize the table.
+        
+        Args:
+            columns: Mapping of column name to array of values
+            row_count: Number of rows in the table
+            schema: Mapping of column name to Python type
+        """
+        self.columns = columns
+        self.row_count = row_count
+        self.schema = schema
+    
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.row_count
+    
+    @property
+    def column_names(self) -> List[str]:
+        """List of column names in table order."""
+        return list(self.columns.keys())
+    
+    def head(self, n: int) -> 'ColumnarTable':
+        """
+        Return the first n rows.
+        
+        Args:
+            n: Maximum number of rows
+            
+        Returns:
+            New ColumnarTable sharing the leading part of each column
+        """
+        columns = {name: arr[:n] for name, arr in self.columns.items()}
+        return ColumnarTable(columns, min(n, self.row_count), self.schema)
+    
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """
+        Build a row-oriented view of the table.
+        
+        Missing numeric values (stored as NaN) are returned as None, and
+        the other values of an integer column stored as floats as int.
+        
+        Returns:
+            List of dictionaries representing rows
+        """
+        names = self.column_names
+        values = []
+        for name in names:
+            arr = self.columns[name]
+            column = arr.tolist()
+            if arr.dtype.kind == 'f' and self.schema.get(name) is int:
+                column = [None if v != v else int(v) for v in column]
+            elif arr.dtype.kind == 'f':
+                column = [None if v != v else v for v in column]
+            values.append(column)
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def load_csv(
+    file_path: str,
+    use_cache: bool = False,
+    predicate: Optional[Callable[[Mapping[str, str]], bool]] = None,
+    columns: Optional[List[str]] = None
+) -> tuple[ColumnarTable, str]:
+    """
+    Load data from a CSV file into a column-oriented table.
+    
+    The file is parsed with pyarrow's multithreaded CSV reader when pyarrow
+    is installed, and with the csv module otherwise; without pyarrow,
+    files of PARALLEL_MIN_BYTES or more are split between worker processes
+    as in load_csv_parallel.
+    
+    With use_cache, a typed copy of files over CACHE_MIN_BYTES is written
+    next to the CSV (<file>.csv.cache/). Later loads of the unchanged file
+    memory-map the cached column arrays instead of parsing the CSV.
+    
+    predicate and columns push a query down into parsing: rows failing
+    the predicate and columns not listed are never stored. The cache only
+    holds complete tables, so it is bypassed when either is given.
+    
+    Args:
+        file_path: Path to the CSV file
+        use_cache: Read and write the on-disk column cache
+        predicate: Function called with each row as a mapping of column
+            name to raw string value; only rows it returns True for are
+            kept. Exceptions it raises propagate to the caller.
+        columns: Names of the columns to keep (None keeps all; unknown
+            names are ignored)
+        
+    Returns:
+        tuple: (ColumnarTable holding the rows, table name derived from filename)
+        
+    Raises:
+        FileNotFoundError: If the CSV file does not exist
+        ValueError: If the file is empty or not a valid CSV
+    """
+    path = _check_csv_path(file_path)
+    
+    # Extract table name from filename (without extension)
+    table_name = path.stem
+    
+    use_cache = use_cache and predicate is None and columns is None
+    
+    if use_cache:
+        table = _read_cache(path)
+        if table is not None:
+            return table, table_name
+    
+    table = None
+    if not PYARROW_AVAILABLE and predicate is None and columns is None:
+        table = _read_in_parallel(file_path)
+    if table is None:
+        table = _read_serially(file_path, predicate, columns)
+    
+    if use_cache and path.stat().st_size > CACHE_MIN_BYTES:
+        _write_cache(path, table)
+    
+    return table, table_name
+
+
+def load_csv_parallel(
+    file_path: str,
+    n_workers: Optional[int] = None
+) -> tuple[ColumnarTable, str]:
+    """
+    Load a large CSV file by parsing newline-aligned chunks in parallel.
+    
+    The file is memory-mapped and split into one byte range per worker,
+    each ending on a line break. Worker processes parse and type their
+    range; the parent concatenates the column arrays. Columns whose type
+    differs between chunks (e.g. int in one, float in another) are parsed
+    again as text and typed over the whole column, so the result matches
+    load_csv.
+    
+    Files under PARALLEL_MIN_BYTES, and files where a chunk boundary
+    would fall inside a quoted field (a field containing a line break),
+    are read in this process as load_csv reads them.
     
     Args:
         file_path: Path to the CSV file
+        n_workers: Number of worker processes (defaults to the CPU count)
         
     Returns:
-        tuple: (list of dictionaries representing rows, table name derived from filename)
+        tuple: (ColumnarTable holding the rows, table name derived from filename)
         
     Raises:
         FileNotFoundError: If the CSV file does not exist
         ValueError: If the file is empty or not a valid CSV
     """
+    path = _check_csv_path(file_path)
+    
+    table = _read_in_parallel(file_path, n_workers)
+    if table is None:
+        table = _read_serially(file_path)
+    
+    return table, path.stem
+
+
+def _read_serially(
+    file_path: str,
+    predicate: Optional[Callable[[Mapping[str, str]], bool]] = None,
+    columns: Optional[List[str]] = None
+) -> ColumnarTable:
+    """
+    Read a CSV file in this process.
+    
+    Args:
+        file_path: Path to the CSV file
+        predicate: Row filter, as for load_csv
+        columns: Names of the columns to keep, or None for all
+        
+    Returns:
+        ColumnarTable holding the rows
+        
+    Raises:
+        ValueError: If the file is empty or not a valid CSV
+    """
+    # The predicate works on raw rows, which only the csv reader sees
+    table = None
+    if PYARROW_AVAILABLE and predicate is None:
+        table = _read_with_pyarrow(file_path, columns)
+    if table is None:
+        table = _read_with_csv(file_path, predicate, columns)
+    return table
+
+
+def _read_in_parallel(
+    file_path: str,
+    n_workers: Optional[int] = None
+) -> Optional[ColumnarTable]:
+    """
+    Read a CSV file by parsing newline-aligned chunks in worker processes.
+    
+    Args:
+        file_path: Path to the CSV file
+        n_workers: Number of worker processes (defaults to the CPU count)
+        
+    Returns:
+        ColumnarTable, or None if the file should be read serially
+        
+    Raises:
+        ValueError: If the file is empty or not a valid CSV
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    
+    if n_workers < 2 or os.path.getsize(file_path) < PARALLEL_MIN_BYTES:
+        return None
+    
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b'\n')
+            data_start = len(mm) if header_end == -1 else header_end + 1
+            header_line = mm[:data_start].decode('utf-8')
+            chunks = _chunk_ranges(mm, data_start, n_workers)
+            split_quotes = _splits_quoted_field(mm, chunks)
+    
+    if split_quotes:
+        return None
+    
+    try:
+        header = next(csv.reader(io.StringIO(header_line, newline='')), None)
+        if not header:
+            raise ValueError("CSV file is empty or has no header row.")
+        
+        width = len(header)
+        starts = [start for start, _ in chunks]
+        ends = [end for _, end in chunks]
+        # Workers are spawned rather than forked: forking a process whose
+        # Numba kernels have started worker threads can deadlock
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        ) as executor:
+            typed = list(executor.map(
+                _convert_chunk, [file_path] * len(chunks), starts, ends,
+                [width] * len(chunks)
+            ))
+            
+            # Positions of the columns that need the whole column to type:
+            # chunks disagree on the type, or an integer column has missing
+            # values in only some chunks
+            mixed = [
+                i for i in range(width)
+                if len({(chunk[i][0], chunk[i][1].dtype) for chunk in typed}) > 1
+            ]
+            raw = []
+            if mixed:
+                raw = list(executor.map(
+                    _parse_chunk, [file_path] * len(chunks), starts, ends,
+                    [width] * len(chunks), [mixed] * len(chunks)
+                ))
+    except csv.Error as e:
+        raise ValueError(f"Error reading CSV file: {e}")
+    except BrokenProcessPool:
+        # Workers could not start, e.g. because the main module loads a
+        # file on import without an `if __name__ == '__main__'` guard
+        return None
+    
+    row_count = sum(len(chunk[0][1]) for chunk in typed)
+    if not row_count:
+        raise ValueError("CSV file has no data rows.")
+    
+    columns = {}
+    schema = {}
+    for i, name in enumerate(header):
+        if i in mixed:
+            k = mixed.index(i)
+            values = [value for chunk in raw for value in chunk[k]]
+            col_type, arr = _convert_column(values)
+        else:
+            # A column empty in every chunk is text, as in load_csv
+            col_type = typed[0][i][0] or str
+            arr = np.concatenate([chunk[i][1] for chunk in typed])
+        if col_type is str:
+            arr = _encode_text_column(arr)
+        columns[name] = arr
+        schema[name] = col_type
+    
+    return ColumnarTable(columns, row_count, schema)
+
+
+def _check_csv_path(file_path: str) -> Path:
+    """
+    Check that a path names an existing CSV file.
+    
+    Args:
+        file_path: Path to the CSV file
+        
+    Returns:
+        The path as a Path
+        
+    Raises:
+        FileNotFoundError: If the CSV file does not exist
+        ValueError: If the path does not have a .csv extension
+    """
     path = Path(file_path)
     
     # Check if file exists
@@ -31,23 +460,694 @@ def load_csv(file_path: str) -> tuple[List[Dict[str, Any]], str]:
     if path.suffix.lower() != '.csv':
         raise ValueError(f"File '{file_path}' is not a CSV file.")
     
-    # Extract table name from filename (without extension)
-    table_name = path.stem
+    return path
+
+
+def _chunk_ranges(mm: mmap.mmap, start: int, n_chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split a byte range into about n_chunks ranges ending on line breaks.
+    
+    Args:
+        mm: Memory-mapped file
+        start: Offset of the first byte to split
+        n_chunks: Number of ranges wanted
+        
+    Returns:
+        List of (start, end) byte offsets covering start to the end of mm
+    """
+    size = len(mm)
+    step = max(1, (size - start) // n_chunks)
+    
+    ranges = []
+    while start < size:
+        end = mm.find(b'\n', min(start + step, size) - 1)
+        end = size if end == -1 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _splits_quoted_field(mm: mmap.mmap, ranges: List[Tuple[int, int]]) -> bool:
+    """
+    Check whether a range boundary falls inside a quoted field.
+    
+    Quotes come in pairs (an escaped quote is written twice), so a
+    boundary is inside a quoted field when an odd number of quote
+    characters precede it. Stray quotes inside unquoted fields can give a
+    false positive, which only costs the parallelism.
+    
+    Args:
+        mm: Memory-mapped file
+        ranges: (start, end) byte offsets from _chunk_ranges
+        
+    Returns:
+        True if the file cannot be split at the range boundaries
+    """
+    if not ranges:
+        return False
+    
+    # The header ends at the first line break, which must not be quoted
+    quotes = mm[:ranges[0][0]].count(b'"')
+    if quotes % 2:
+        return True
+    
+    for start, end in ranges[:-1]:
+        quotes += mm[start:end].count(b'"')
+        if quotes % 2:
+            return True
+    return False
+
+
+def _parse_chunk(
+    file_path: str,
+    start: int,
+    end: int,
+    width: int,
+    positions: Optional[List[int]] = None
+) -> List[List[str]]:
+    """
+    Parse a newline-aligned byte range of a CSV file into raw columns.
+    
+    Runs in a worker process of load_csv_parallel, so it reopens the file
+    rather than receiving the data.
+    
+    Args:
+        file_path: Path to the CSV file
+        start: Offset of the first byte of the range
+        end: Offset just past the last byte of the range
+        width: Number of columns in the header
+        positions: Positions of the columns to return, or None for all
+        
+    Returns:
+        List of raw string values for each requested column
+    """
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = mm[start:end].decode('utf-8')
+    
+    if positions is None:
+        positions = list(range(width))
+    
+    values: List[List[str]] = [[] for _ in positions]
+    appends = [column.append for column in values]
+    padding = [''] * width
+    for row in csv.reader(io.StringIO(text, newline='')):
+        if not row:
+            # Skip blank lines
+            continue
+        if len(row) != width:
+            # Missing fields are empty, extra fields are dropped
+            row = (row + padding)[:width]
+        for append, i in zip(appends, positions):
+            append(row[i])
+    return values
+
+
+def _convert_chunk(
+    file_path: str,
+    start: int,
+    end: int,
+    width: int
+) -> List[Tuple[Optional[type], np.ndarray]]:
+    """
+    Parse a newline-aligned byte range of a CSV file into typed columns.
+    
+    Args:
+        file_path: Path to the CSV file
+        start: Offset of the first byte of the range
+        end: Offset just past the last byte of the range
+        width: Number of columns in the header
+        
+    Returns:
+        List of (type, array) for each column. The type is None for a
+        column with only empty values, whose type depends on the other
+        chunks.
+    """
+    converted = []
+    for column in _parse_chunk(file_path, start, end, width):
+        col_type, arr = _convert_column(column)
+        if col_type is str and not any(column):
+            col_type = None
+        converted.append((col_type, arr))
+    return converted
+
+
+def _cache_key(path: Path) -> Dict[str, int]:
+    """
+    Identify the current version of a CSV file.
     
+    Args:
+        path: Path to the CSV file
+        
+    Returns:
+        Dictionary with the file's modification time and size
+    """
+    stat = path.stat()
+    return {'version': _CACHE_VERSION, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def _read_cache(path: Path) -> Optional[ColumnarTable]:
+    """
+    Load a table from the on-disk cache of a CSV file.
+    
+    Numeric columns and category codes are memory-mapped read-only, so
+    they are paged in from disk only when a query touches them.
+    
+    Args:
+        path: Path to the CSV file
+        
+    Returns:
+        ColumnarTable, or None if there is no cache for the current file
+    """
+    cache_dir = path.with_name(path.name + CACHE_SUFFIX)
+    try:
+        with open(cache_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    columns = {}
+    schema = {}
+    try:
+        if meta.get('key') != _cache_key(path):
+            return None
+        
+        row_count = meta['row_count']
+        for i, column in enumerate(meta['columns']):
+            name = column['name']
+            if column['encoding'] == 'categorical':
+                codes = np.load(cache_dir / f'{i}.codes.npy', mmap_mode='r')
+                categories = _load_text(cache_dir, f'{i}.categories')
+                columns[name] = CategoricalColumn(np.asarray(codes), categories)
+            elif column['encoding'] == 'text':
+                columns[name] = _load_text(cache_dir, str(i))
+            else:
+                # np.asarray drops the memmap subclass but keeps the mapping
+                columns[name] = np.asarray(
+                    np.load(cache_dir / f'{i}.npy', mmap_mode='r')
+                )
+            schema[name] = _SCHEMA_TYPES[column['type']]
+    except (OSError, ValueError, KeyError, MemoryError):
+        return None
+    except (AttributeError, TypeError):
+        # meta.json parsed, but does not have the layout _write_cache writes
+        return None
+    
+    return ColumnarTable(columns, row_count, schema)
+
+
+def _write_cache(path: Path, table: ColumnarTable) -> None:
+    """
+    Write the on-disk cache of a CSV file.
+    
+    Text is stored as UTF-8 bytes plus offsets so no pickling is involved
+    and long values cost only their own length. Failing to write the
+    cache never fails the load.
+    
+    Args:
+        path: Path to the CSV file
+        table: Table loaded from the file
+    """
+    cache_dir = path.with_name(path.name + CACHE_SUFFIX)
+    columns = []
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        for i, (name, arr) in enumerate(table.columns.items()):
+            if isinstance(arr, CategoricalColumn):
+                encoding = 'categorical'
+                np.save(cache_dir / f'{i}.codes.npy', arr.codes)
+                _save_text(cache_dir, f'{i}.categories', arr.categories)
+            elif arr.dtype.kind == 'O':
+                encoding = 'text'
+                _save_text(cache_dir, str(i), arr)
+            else:
+                encoding = 'array'
+                np.save(cache_dir / f'{i}.npy', arr)
+            columns.append({
+                'name': name,
+                'type': table.schema[name].__name__,
+                'encoding': encoding,
+            })
+        
+        # meta.json is written last, so a partial cache is never used
+        meta = {
+            'key': _cache_key(path),
+            'row_count': table.row_count,
+            'columns': columns,
+        }
+        with open(cache_dir / 'meta.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+    except (OSError, MemoryError):
+        pass
+
+
+def _save_text(cache_dir: Path, stem: str, arr: np.ndarray) -> None:
+    """
+    Save a text array as <stem>.data.npy (UTF-8 bytes) and
+    <stem>.offsets.npy (start of each value, plus the total length).
+    
+    Args:
+        cache_dir: Cache directory
+        stem: File name prefix
+        arr: Object array of strings
+    """
+    encoded = [value.encode('utf-8') for value in arr.tolist()]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    np.save(cache_dir / f'{stem}.data.npy', data)
+    np.save(cache_dir / f'{stem}.offsets.npy', offsets)
+
+
+def _load_text(cache_dir: Path, stem: str) -> np.ndarray:
+    """
+    Load a text array saved by _save_text.
+    
+    Args:
+        cache_dir: Cache directory
+        stem: File name prefix
+        
+    Returns:
+        Object array of strings
+        
+    Raises:
+        OSError: If a file is missing
+        ValueError: If a file is not a valid array or not UTF-8
+    """
+    data = np.load(cache_dir / f'{stem}.data.npy').tobytes()
+    bounds = np.load(cache_dir / f'{stem}.offsets.npy').tolist()
+    return np.array(
+        [data[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])],
+        dtype=object
+    )
+
+
+def _read_with_pyarrow(
+    file_path: str,
+    columns: Optional[List[str]] = None
+) -> Optional[ColumnarTable]:
+    """
+    Read a CSV file with pyarrow's CSV reader.
+    
+    Every column is read as text and then typed with the same number
+    patterns as _read_with_csv, since pyarrow's own inference accepts
+    other spellings (e.g. ' 42 ' or '0x10' as integers).
+    
+    Args:
+        file_path: Path to the CSV file
+        columns: Names of the columns to keep, or None for all
+        
+    Returns:
+        ColumnarTable, or None if pyarrow cannot parse the file
+        
+    Raises:
+        ValueError: If the file has no data rows
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), None)
+    except (csv.Error, UnicodeDecodeError):
+        return None
+    if header is None:
+        return None
+    
+    if len(set(header)) < len(header):
+        # pyarrow cannot select a name that appears twice; the csv module
+        # keeps the last column of that name
+        return None
+    
+    if columns is not None:
+        # pyarrow rejects a column listed twice
+        columns = list(dict.fromkeys(columns))
+    
+    # Take the names from the header read above, so that both readers
+    # agree on them (pyarrow would drop a byte order mark the csv module
+    # keeps)
+    read_options = pacsv.ReadOptions(
+        block_size=ARROW_BLOCK_SIZE,
+        column_names=header,
+        skip_rows=1
+    )
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in header},
+        # Empty fields stay '', as in _read_with_csv
+        strings_can_be_null=False,
+        # An empty list would mean all columns
+        include_columns=columns or None
+    )
+    
+    try:
+        arrow_table = pacsv.read_csv(
+            file_path,
+            read_options=read_options,
+            convert_options=convert_options
+        )
+    except (pa.ArrowException, UnicodeDecodeError):
+        # Let the csv module handle (and report) files pyarrow rejects,
+        # and column lists naming columns the file does not have
+        return None
+    
+    if not arrow_table.num_rows:
+        raise ValueError("CSV file has no data rows.")
+    
+    names = arrow_table.column_names if columns is None else columns
+    
+    table_columns = {}
+    schema = {}
+    try:
+        for name in names:
+            col_type, arr = _convert_arrow_column(arrow_table.column(name))
+            if col_type is str:
+                arr = _encode_text_column(arr)
+            table_columns[name] = arr
+            schema[name] = col_type
+    except pa.ArrowException:
+        return None
+    
+    return ColumnarTable(table_columns, arrow_table.num_rows, schema)
+
+
+def _convert_arrow_column(column: 'pa.ChunkedArray') -> Tuple[type, np.ndarray]:
+    """
+    Convert a pyarrow text column like _convert_column, using vectorized
+    pattern matching and casts.
+    
+    Args:
+        column: Raw string values of the column
+        
+    Returns:
+        tuple: (int, float or str, NumPy array of the values)
+    """
+    empty = pc.equal(column, '')
+    empty_count = pc.sum(empty).as_py() or 0
+    
+    try:
+        if empty_count < len(column):
+            is_int = pc.match_substring_regex(column, f'^(?:{_INT_PATTERN})$')
+            if not empty_count and pc.all(is_int).as_py():
+                return int, pc.cast(column, pa.int64()).to_numpy()
+            
+            # Empty fields become NaN, as in _to_array
+            values = pc.if_else(empty, pa.scalar(None, pa.string()), column)
+            
+            if pc.all(pc.or_(is_int, empty)).as_py():
+                ints = pc.cast(values, pa.int64())
+                bounds = pc.min_max(ints)
+                if (-_MAX_EXACT_INT <= bounds['min'].as_py()
+                        and bounds['max'].as_py() <= _MAX_EXACT_INT):
+                    return int, pc.cast(ints, pa.float64()).to_numpy(zero_copy_only=False)
+            
+            is_float = pc.match_substring_regex(column, f'^(?:{_FLOAT_PATTERN})$')
+            if pc.all(pc.or_(is_float, empty)).as_py():
+                return float, pc.cast(values, pa.float64()).to_numpy(zero_copy_only=False)
+    except pa.ArrowInvalid:
+        # Values pyarrow cannot cast (e.g. integers beyond 64 bits or a
+        # leading '+') are converted one by one
+        return _convert_column(column.to_pylist())
+    
+    return str, column.to_numpy(zero_copy_only=False).astype(object, copy=False)
+
+
+def _read_with_csv(
+    file_path: str,
+    predicate: Optional[Callable[[Mapping[str, str]], bool]] = None,
+    columns: Optional[List[str]] = None
+) -> ColumnarTable:
+    """
+    Read a CSV file with the csv module.
+    
+    Args:
+        file_path: Path to the CSV file
+        predicate: Function deciding from the raw row whether to keep it,
+            or None to keep every row
+        columns: Names of the columns to keep, or None for all
+        
+    Returns:
+        ColumnarTable holding the rows
+        
+    Raises:
+        ValueError: If the file is empty or not a valid CSV
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(
+            file_path, 'r', encoding='utf-8', newline='',
+            buffering=CSV_BUFFER_SIZE
+        ) as f:
+            reader = csv.reader(f)
             
-            if reader.fieldnames is None:
+            header = next(reader, None)
+            if header is None:
                 raise ValueError("CSV file is empty or has no header row.")
             
-            # Load all rows into a list of dictionaries
-            rows = list(reader)
+            positions = [
+                i for i, name in enumerate(header)
+                if columns is None or name in columns
+            ]
+            view = _RowView(header)
             
-            if not rows:
-                raise ValueError("CSV file has no data rows.")
+            # Collect values column by column in a single pass, using
+            # positional rows so no per-row dictionary is built
+            width = len(header)
+            values: List[List[str]] = [[] for _ in positions]
+            appends = [column.append for column in values]
+            padding = [''] * width
+            total_rows = 0
+            row_count = 0
+            for row in reader:
+                if not row:
+                    # Skip blank lines
+                    continue
+                if len(row) != width:
+                    # Missing fields are empty, extra fields are dropped
+                    row = (row + padding)[:width]
+                total_rows += 1
+                
+                if predicate is not None:
+                    view.row = row
+                    if not predicate(view):
+                        continue
+                
+                for append, i in zip(appends, positions):
+                    append(row[i])
+                row_count += 1
             
-            return rows, table_name
+            if not total_rows:
+                raise ValueError("CSV file has no data rows.")
             
+            names = [header[i] for i in positions]
+            return _build_table(dict(zip(names, values)), row_count)
+    
     except csv.Error as e:
         raise ValueError(f"Error reading CSV file: {e}")
+
+
+class _RowView(Mapping):
+    """
+    Read-only mapping of column name to value for a positional CSV row.
+    
+    A single view is reused for every row by reassigning row, so passing
+    rows to a predicate allocates nothing.
+    """
+    
+    def __init__(self, header: List[str]):
+        """
+        Initialize the view.
+        
+        Args:
+            header: Column names in file order
+        """
+        self._positions = {name: i for i, name in enumerate(header)}
+        self.row: List[str] = []
+    
+    def __getitem__(self, name: str) -> str:
+        """Return the raw value of a column in the current row."""
+        return self.row[self._positions[name]]
+    
+    def __iter__(self):
+        """Iterate over the column names."""
+        return iter(self._positions)
+    
+    def __len__(self) -> int:
+        """Return the number of columns."""
+        return len(self._positions)
+
+
+def _build_table(values: Dict[str, List[str]], row_count: int) -> ColumnarTable:
+    """
+    Convert raw string columns into a typed ColumnarTable.
+    
+    Args:
+        values: Mapping of column name to list of raw string values
+        row_count: Number of rows
+        
+    Returns:
+        ColumnarTable with one typed array per column
+    """
+    columns = {}
+    schema = {}
+    for name, column in values.items():
+        col_type, arr = _convert_column(column)
+        if col_type is str:
+            arr = _encode_text_column(arr)
+        columns[name] = arr
+        schema[name] = col_type
+    return ColumnarTable(columns, row_count, schema)
+
+
+def _convert_column(column: List[str]) -> Tuple[type, np.ndarray]:
+    """
+    Convert raw string values to an array of the narrowest fitting type.
+    
+    Args:
+        column: Raw string values of the column
+        
+    Returns:
+        tuple: (int, float or str, NumPy array of the values)
+    """
+    candidates = _TYPE_ORDER[_TYPE_ORDER.index(_infer_column_type(column)):]
+    for col_type in candidates:
+        try:
+            return col_type, _to_array(column, col_type)
+        except (ValueError, OverflowError):
+            # The sample did not represent the whole column
+            continue
+
+
+def _encode_text_column(arr: np.ndarray) -> Union[np.ndarray, CategoricalColumn]:
+    """
+    Dictionary-encode a text column if it has few distinct values.
+    
+    Args:
+        arr: Object array of strings
+        
+    Returns:
+        CategoricalColumn for long, low-cardinality columns, otherwise arr
+    """
+    if len(arr) <= CATEGORICAL_MIN_ROWS:
+        return arr
+    
+    if len(set(arr.tolist())) >= CATEGORICAL_MAX_RATIO * len(arr):
+        return arr
+    
+    categories, codes = np.unique(arr, return_inverse=True)
+    return CategoricalColumn(codes.astype(np.int32), categories)
+
+
+def _infer_column_type(column: List[str]) -> type:
+    """
+    Guess the type of a column from a sample of its non-empty values.
+    
+    Args:
+        column: Raw string values of the column
+        
+    Returns:
+        int, float or str
+    """
+    sample = []
+    for value in column:
+        if value != '':
+            sample.append(value)
+            if len(sample) >= TYPE_SAMPLE_SIZE:
+                break
+    
+    if not sample:
+        return str
+    
+    for candidate in (int, float):
+        pattern = _INT_RE if candidate is int else _FLOAT_RE
+        if all(pattern.fullmatch(value) for value in sample):
+            return candidate
+    
+    return str
+
+
+def _to_array(column: List[str], col_type: type) -> np.ndarray:
+    """
+    Convert raw string values to an array of the given type.
+    
+    Args:
+        column: Raw string values of the column
+        col_type: Target type (int, float or str)
+        
+    Returns:
+        NumPy array (int64, float64 or object). Integers with missing
+        values are stored as float64, with NaN for the missing values.
+        
+    Raises:
+        ValueError: If a value cannot be converted, or an integer column
+            with missing values holds an integer floats cannot store exactly
+        OverflowError: If an integer does not fit in 64 bits
+    """
+    if col_type is int and '' in column:
+        values = []
+        for v in column:
+            if v == '':
+                values.append(np.nan)
+                continue
+            number = _parse_int(v)
+            if abs(number) > _MAX_EXACT_INT:
+                raise ValueError(f"'{v}' cannot be stored exactly as a float")
+            values.append(number)
+        return np.array(values, dtype=np.float64)
+    if col_type is int:
+        return np.array([_parse_int(v) for v in column], dtype=np.int64)
+    if col_type is float:
+        return np.array(
+            [_parse_float(v) if v != '' else np.nan for v in column],
+            dtype=np.float64
+        )
+    return np.array(column, dtype=object)
+
+
+def parse_number(value: str) -> Union[int, float]:
+    """
+    Parse a raw CSV value the way a numeric column would store it.
+    
+    Args:
+        value: Raw string value
+        
+    Returns:
+        int for integers, float for other numbers
+        
+    Raises:
+        ValueError: If the value is not a number a column would be typed as
+    """
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    return _parse_float(value)
+
+
+def _parse_int(value: str) -> int:
+    """
+    Parse a raw value matching _INT_PATTERN.
+    
+    Args:
+        value: Raw string value
+        
+    Returns:
+        The integer
+        
+    Raises:
+        ValueError: If the value is not an integer
+    """
+    if not _INT_RE.fullmatch(value):
+        raise ValueError(f"'{value}' is not an integer")
+    return int(value)
+
+
+def _parse_float(value: str) -> float:
+    """
+    Parse a raw value matching _FLOAT_PATTERN.
+    
+    Args:
+        value: Raw string value
+        
+    Returns:
+        The number as a float
+        
+    Raises:
+        ValueError: If the value is not a number
+    """
+    if not _FLOAT_RE.fullmatch(value):
+        raise ValueError(f"'{value}' is not a number")
+    return float(value)
@@ -2,22 +2,40 @@
 Command-line interface for the SQL query engine.
 """
 
-from typing import List, Dict, Any
+import argparse
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
+import numpy as np
 from tabulate import tabulate
 
-from data_loader import load_csv
-from sql_parser import parse_query, QueryParseError
-from query_executor import execute_query, ExecutionError
+from data_loader import load_csv, ColumnarTable
+from sql_parser import parse_query, ParsedQuery, QueryParseError
+from query_executor import execute_query, make_row_predicate, ExecutionError
+
+
+# Results with more rows than this are printed as a preview
+DISPLAY_ROW_LIMIT = 100
+
+# Number of rows shown in a preview
+PREVIEW_ROWS = 50
 
 
 class SQLEngine:
     """Interactive SQL query engine."""
     
-    def __init__(self):
-        """Initialize the SQL engine."""
-        self.data: List[Dict[str, Any]] = []
+    def __init__(self, use_cache: bool = False):
+        """
+        Initialize the SQL engine.
+        
+        Args:
+            use_cache: Keep an on-disk column cache of large CSV files
+        """
+        self.use_cache = use_cache
+        self.data: Optional[ColumnarTable] = None
         self.table_name: str = ""
         self.is_loaded = False
+        # Sorted column indexes built by range queries on the loaded table
+        self._indexes: Dict[str, tuple[np.ndarray, np.ndarray]] = {}
     
     def load_table(self, file_path: str) -> None:
         """
@@ -31,12 +49,13 @@ class SQLEngine:
             ValueError: If file is invalid
         """
         try:
-            self.data, self.table_name = load_csv(file_path)
+            self.data, self.table_name = load_csv(file_path, self.use_cache)
+            self._indexes = {}
             self.is_loaded = True
             print(f"\n[OK] Successfully loaded '{file_path}'")
             print(f"  Table name: {self.table_name}")
             print(f"  Rows: {len(self.data)}")
-            print(f"  Columns: {', '.join(self.data[0].keys())}\n")
+            print(f"  Columns: {', '.join(self.data.column_names)}\n")
         except (FileNotFoundError, ValueError) as e:
             print(f"\n[ERROR] Error loading file: {e}\n")
     
@@ -56,15 +75,15 @@ class SQLEngine:
             parsed = parse_query(query)
             
             # Validate table name matches loaded table
-            if parsed['from_table'] != self.table_name:
+            if parsed.from_table != self.table_name:
                 print(
-                    f"\n[ERROR] Table '{parsed['from_table']}' not found. "
+                    f"\n[ERROR] Table '{parsed.from_table}' not found. "
                     f"Currently loaded table: '{self.table_name}'\n"
                 )
                 return
             
             # Execute the query
-            result = execute_query(self.data, parsed)
+            result = execute_query(self.data, parsed, self._indexes)
             
             # Display results
             self._display_results(result)
@@ -76,20 +95,120 @@ class SQLEngine:
         except Exception as e:
             print(f"\n[ERROR] Unexpected Error: {e}\n")
     
-    def _display_results(self, result: List[Dict[str, Any]]) -> None:
+    def run_query(self, query: str, file_path: str) -> None:
+        """
+        Load only what a single query needs from a CSV file and run it.
+        
+        Args:
+            query: SQL query string
+            file_path: Path to the CSV file the query reads
+        """
+        try:
+            parsed = parse_query(query)
+            
+            table_name = Path(file_path).stem
+            if parsed.from_table != table_name:
+                print(
+                    f"\n[ERROR] Table '{parsed.from_table}' not found. "
+                    f"Table in '{file_path}': '{table_name}'\n"
+                )
+                return
+            
+            result = self.query_file(parsed, file_path)
+            
+            self._display_results(result)
+            
+        except (FileNotFoundError, ValueError) as e:
+            print(f"\n[ERROR] Error loading file: {e}\n")
+        except QueryParseError as e:
+            print(f"\n[ERROR] Parse Error: {e}\n")
+        except ExecutionError as e:
+            print(f"\n[ERROR] Execution Error: {e}\n")
+        except Exception as e:
+            print(f"\n[ERROR] Unexpected Error: {e}\n")
+    
+    def query_file(
+        self,
+        parsed: ParsedQuery,
+        file_path: str
+    ) -> Union[ColumnarTable, List[Dict[str, Any]]]:
+        """
+        Execute a parsed query against a CSV file it is pushed down into.
+        
+        The WHERE clause is evaluated while the file is parsed and only
+        the columns the query uses are kept, so rows and columns it does
+        not need are never stored.
+        
+        Args:
+            parsed: ParsedQuery from parse_query()
+            file_path: Path to the CSV file the query reads
+            
+        Returns:
+            Query result, as returned by execute_query
+            
+        Raises:
+            FileNotFoundError: If the CSV file does not exist
+            ValueError: If the file is invalid
+            ExecutionError: If columns don't exist or values can't be compared
+        """
+        predicate = make_row_predicate(parsed.where_clause)
+        
+        # Columns the query reads; None keeps every column
+        aggregate = parsed.aggregate
+        if aggregate:
+            columns = [] if aggregate.column == '*' else [aggregate.column]
+        elif parsed.select_cols == ('*',):
+            columns = None
+        else:
+            columns = list(parsed.select_cols)
+        if columns is not None and predicate is None and parsed.where_clause:
+            columns.append(parsed.where_clause.col)
+        if columns is not None:
+            # A column named twice is loaded once
+            columns = list(dict.fromkeys(columns))
+        
+        data, _ = load_csv(file_path, self.use_cache, predicate, columns)
+        
+        # Rows were already filtered while loading
+        if predicate is not None:
+            parsed = parsed._replace(where_clause=None)
+        return execute_query(data, parsed)
+    
+    def _display_results(
+        self,
+        result: Union[ColumnarTable, List[Dict[str, Any]]]
+    ) -> None:
         """
         Display query results in a formatted table.
         
         Args:
-            result: List of result rows
+            result: ColumnarTable or list of result rows
         """
         if not result:
             print("\n(No results)\n")
             return
         
+        row_count = len(result)
+        
+        if row_count > DISPLAY_ROW_LIMIT:
+            # tabulate scans and formats every cell, so large results are
+            # shown as a short aligned preview instead
+            if isinstance(result, ColumnarTable):
+                preview = result.head(PREVIEW_ROWS).to_rows()
+            else:
+                preview = result[:PREVIEW_ROWS]
+            print()
+            print(_format_preview(preview))
+            print(f"... {row_count - len(preview)} more rows")
+            print(f"\nRows returned: {row_count}\n")
+            return
+        
+        if isinstance(result, ColumnarTable):
+            result = result.to_rows()
+        
         print()
         print(tabulate(result, headers='keys', tablefmt='grid'))
-        print(f"\nRows returned: {len(result)}\n")
+        print(f"\nRows returned: {row_count}\n")
     
     def show_help(self) -> None:
         """Display help information."""
@@ -128,9 +247,85 @@ VALUE FORMATS:
         print(help_text)
 
 
+def _format_preview(rows: List[Dict[str, Any]]) -> str:
+    """
+    Format rows as a simple aligned text table.
+    
+    Column widths are computed in a single pass over the given rows.
+    Numbers are right-aligned and other values left-aligned.
+    
+    Args:
+        rows: Non-empty list of rows sharing the same keys
+        
+    Returns:
+        Formatted table as a string
+    """
+    headers = list(rows[0].keys())
+    cells = [[_format_cell(row[col]) for col in headers] for row in rows]
+    widths = [
+        max(len(header), max(len(line[i]) for line in cells))
+        for i, header in enumerate(headers)
+    ]
+    numeric = [
+        all(isinstance(row[col], (int, float)) for row in rows if row[col] is not None)
+        for col in headers
+    ]
+    
+    def format_line(values: List[str]) -> str:
+        return ' | '.join(
+            value.rjust(width) if is_numeric else value.ljust(width)
+            for value, width, is_numeric in zip(values, widths, numeric)
+        )
+    
+    lines = [format_line(headers), '-+-'.join('-' * width for width in widths)]
+    lines.extend(format_line(line) for line in cells)
+    return '\n'.join(lines)
+
+
+def _format_cell(value: Any) -> str:
+    """
+    Format a value for _format_preview the way tabulate formats it.
+    
+    Args:
+        value: Cell value
+        
+    Returns:
+        Empty string for None, floats in 'g' format, str() otherwise
+    """
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        return format(value, 'g')
+    return str(value)
+
+
 def main():
     """Main entry point for the CLI."""
-    engine = SQLEngine()
+    parser = argparse.ArgumentParser(description="Mini SQL Database Engine")
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help="cache large CSV files on disk (<file>.csv.cache/) for faster reloads"
+    )
+    parser.add_argument(
+        'query',
+        nargs='?',
+        help="run a single query and exit instead of starting the shell"
+    )
+    parser.add_argument(
+        'file',
+        nargs='?',
+        help="CSV file the query reads"
+    )
+    args = parser.parse_args()
+    
+    engine = SQLEngine(use_cache=args.cache)
+    
+    if args.query is not None:
+        if args.file is None:
+            parser.error("a query needs the CSV file it reads")
+        engine.run_query(args.query, args.file)
+        return
     
     print("""
 ==================================================================
@@ -2,7 +2,22 @@
 Module for executing parsed SQL queries against in-memory data.
 """
 
-from typing import List, Dict, Any, Optional
+import operator
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from data_loader import ColumnarTable, CategoricalColumn, parse_number
+from sql_parser import ParsedQuery, WhereClause, Aggregate
+from query_executor_kernels import KERNEL_MIN_ROWS, filter_kernel, count_kernel
+
+try:
+    from _engine_core import filter_rows, project_rows
+    ENGINE_CORE_AVAILABLE = True
+except ImportError:
+    ENGINE_CORE_AVAILABLE = False
 
 
 class ExecutionError(Exception):
@@ -10,10 +25,42 @@ class ExecutionError(Exception):
     pass
 
 
+# Comparison function for each WHERE operator
+_OPS = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+# Vectorized counterparts used on columnar tables
+_NP_OPS = {
+    '=': np.equal,
+    '!=': np.not_equal,
+    '>': np.greater,
+    '<': np.less,
+    '>=': np.greater_equal,
+    '<=': np.less_equal,
+}
+
+# Operator codes understood by _engine_core.filter_rows
+_OP_CODES = {'=': 0, '!=': 1, '>': 2, '<': 3, '>=': 4, '<=': 5}
+
+# Range operators that can be answered from a sorted index
+_RANGE_OPS = {'>', '<', '>=', '<='}
+
+# Numeric columns longer than this get a sorted index on the first range
+# filter, when the caller provides an index cache
+INDEX_MIN_ROWS = 10_000
+
+
 def execute_query(
-    data: List[Dict[str, Any]],
-    parsed_query: Dict[str, Any]
-) -> List[Dict[str, Any]]:
+    data: Union[ColumnarTable, List[Dict[str, Any]]],
+    parsed_query: ParsedQuery,
+    indexes: Optional[Dict[str, tuple[np.ndarray, np.ndarray]]] = None
+) -> Union[ColumnarTable, List[Dict[str, Any]]]:
     """
     Execute a parsed SQL query against in-memory data.
     
@@ -22,29 +69,53 @@ def execute_query(
         2. Apply aggregation (COUNT) if present
         3. Apply projection (SELECT clause)
         
+    COUNT queries evaluate the WHERE clause and the count in a single pass
+    without building the filtered rows.
+    
     Args:
-        data: List of dictionaries representing rows
-        parsed_query: Dictionary from sql_parser.parse_query()
-        
+        data: ColumnarTable or list of dictionaries representing rows
+        parsed_query: ParsedQuery from sql_parser.parse_query()
+        indexes: Optional cache of sorted column indexes for this table,
+            filled on demand by range filters on a ColumnarTable
+            
     Returns:
-        List of dictionaries with query results
+        ColumnarTable for SELECT queries on a ColumnarTable, otherwise a
+        list of dictionaries with query results
         
     Raises:
         ExecutionError: If columns don't exist or operations fail
     """
     
+    where_clause = parsed_query.where_clause
+    aggregate = parsed_query.aggregate
+    
+    # SELECT * without WHERE returns every row unchanged. Callers only
+    # read results, so the table itself is returned rather than a copy.
+    if not where_clause and not aggregate and parsed_query.select_cols == ('*',):
+        return data
+    
+    if aggregate and aggregate.function.upper() == 'COUNT':
+        return [_count_with_where(data, where_clause, aggregate, indexes)]
+    
+    if isinstance(data, ColumnarTable):
+        if not aggregate:
+            mask = _apply_where_columnar(data, where_clause, indexes)
+            return _project_columnar(data, mask, parsed_query.select_cols)
+        
+        data = data.to_rows()
+    
     # Step 1: Apply WHERE clause
-    filtered_data = _apply_where_clause(data, parsed_query['where_clause'])
+    filtered_data = _apply_where_clause(data, where_clause)
     
     # Step 2: Apply aggregation
-    if parsed_query['aggregate']:
-        result = _apply_aggregation(filtered_data, parsed_query['aggregate'])
+    if parsed_query.aggregate:
+        result = _apply_aggregation(filtered_data, parsed_query.aggregate)
         return [result]
     
     # Step 3: Apply projection (SELECT)
     result_data = _apply_projection(
         filtered_data,
-        parsed_query['select_cols']
+        parsed_query.select_cols
     )
     
     return result_data
@@ -52,36 +123,52 @@ def execute_query(
 
 def _apply_where_clause(
     data: List[Dict[str, Any]],
-    where_clause: Optional[Dict[str, Any]]
+    where_clause: Optional[WhereClause]
 ) -> List[Dict[str, Any]]:
     """
     Filter rows based on WHERE clause condition.
     
     Args:
         data: List of rows
-        where_clause: Dictionary with 'col', 'op', 'val' or None
+        where_clause: WhereClause or None
         
     Returns:
         Filtered list of rows
         
     Raises:
-        ExecutionError: If column doesn't exist
+        ExecutionError: If column doesn't exist or operator is unknown
     """
     
     if not where_clause:
         return data
     
-    col = where_clause['col']
-    op = where_clause['op']
-    val = where_clause['val']
+    col = where_clause.col
+    op = where_clause.op
+    val = where_clause.val
+    
+    if op not in _OPS:
+        raise ExecutionError(f"Unknown operator: '{op}'")
+    op_fn = _OPS[op]
+    
+    # Every row has the same columns, so checking the first is enough
+    if data and col not in data[0]:
+        raise ExecutionError(f"Column '{col}' not found in table.")
+    
+    if ENGINE_CORE_AVAILABLE and type(data) is list:
+        try:
+            return filter_rows(data, col, _OP_CODES[op], val)
+        except ValueError as e:
+            raise ExecutionError(
+                f"Cannot compare column '{col}' with value '{val}': {e}"
+            )
+        except TypeError:
+            # The extension only takes dict rows; the loop below accepts
+            # any mapping
+            pass
     
     filtered = []
     
     for row in data:
-        # Check if column exists in row
-        if col not in row:
-            raise ExecutionError(f"Column '{col}' not found in table.")
-        
         row_val = row[col]
         
         # Try to convert row value to same type as comparison value
@@ -93,16 +180,342 @@ def _apply_where_clause(
             )
         
         # Apply comparison
-        if _compare(row_val, op, val):
+        if op_fn(row_val, val):
             filtered.append(row)
     
     return filtered
 
 
+def make_row_predicate(
+    where_clause: Optional[WhereClause]
+) -> Optional[Callable[[Mapping[str, str]], bool]]:
+    """
+    Build a WHERE predicate over raw CSV values for data_loader.load_csv.
+    
+    Pushing the predicate into loading means rows that fail it are never
+    stored. Values are parsed with the same number patterns as column
+    typing, with empty fields treated as missing (NaN), as
+    _apply_where_columnar does.
+    
+    Only numeric literals are pushed down. A string literal compares as
+    text or raises, depending on the column type, and that type is only
+    known once the column is loaded.
+    
+    Args:
+        where_clause: WhereClause or None
+        
+    Returns:
+        Function taking a mapping of column name to raw value, or None if
+        the clause cannot be evaluated during loading
+    """
+    
+    if not where_clause or where_clause.op not in _OPS:
+        return None
+    
+    col, op, val = where_clause
+    if isinstance(val, str):
+        return None
+    op_fn = _OPS[op]
+    
+    def numeric_predicate(row: Mapping[str, str]) -> bool:
+        try:
+            raw = row[col]
+        except KeyError:
+            raise ExecutionError(f"Column '{col}' not found in table.")
+        
+        if raw == '':
+            return op_fn(np.nan, val)
+        try:
+            return op_fn(parse_number(raw), val)
+        except ValueError:
+            raise ExecutionError(
+                f"Cannot compare column '{col}' with value '{val}': "
+                "column is not numeric"
+            )
+    
+    return numeric_predicate
+
+
+def _apply_where_columnar(
+    table: ColumnarTable,
+    where_clause: Optional[WhereClause],
+    indexes: Optional[Dict[str, tuple[np.ndarray, np.ndarray]]] = None
+) -> Optional[np.ndarray]:
+    """
+    Evaluate a WHERE clause against a column as a single NumPy comparison.
+    
+    The comparison value is coerced once to the column type recorded in
+    the table schema, so no per-row conversion is needed.
+    
+    Args:
+        table: Table to filter
+        where_clause: WhereClause or None
+        indexes: Optional cache of sorted column indexes for this table
+        
+    Returns:
+        Boolean mask of matching rows, or None if there is no WHERE clause
+        
+    Raises:
+        ExecutionError: If column doesn't exist, the value cannot be
+            compared with the column or operator is unknown
+    """
+    
+    if not where_clause:
+        return None
+    
+    arr, op, val = _resolve_where_columnar(table, where_clause)
+    
+    if isinstance(arr, CategoricalColumn):
+        return _categorical_mask(arr, op, val)
+    
+    bounds = _index_bounds(where_clause.col, arr, op, val, indexes)
+    if bounds is not None:
+        order, lo, hi = bounds
+        mask = np.zeros(len(arr), dtype=bool)
+        mask[order[lo:hi]] = True
+        return mask
+    
+    # Large numeric columns use a compiled kernel when Numba is installed
+    kernel = filter_kernel(arr.dtype, op) if _kernel_accepts(arr, val) else None
+    if kernel is not None:
+        return kernel(arr, val)
+    
+    return _NP_OPS[op](arr, val)
+
+
+def _count_where_columnar(
+    table: ColumnarTable,
+    where_clause: WhereClause,
+    indexes: Optional[Dict[str, tuple[np.ndarray, np.ndarray]]] = None
+) -> int:
+    """
+    Count the rows of a columnar table matching a WHERE clause.
+    
+    Args:
+        table: Table to filter
+        where_clause: WhereClause
+        indexes: Optional cache of sorted column indexes for this table
+        
+    Returns:
+        Number of matching rows
+        
+    Raises:
+        ExecutionError: If column doesn't exist, the value cannot be
+            compared with the column or operator is unknown
+    """
+    
+    arr, op, val = _resolve_where_columnar(table, where_clause)
+    
+    if isinstance(arr, CategoricalColumn):
+        return int(_categorical_mask(arr, op, val).sum())
+    
+    bounds = _index_bounds(where_clause.col, arr, op, val, indexes)
+    if bounds is not None:
+        _, lo, hi = bounds
+        return hi - lo
+    
+    # The count kernel tallies matches without allocating a mask
+    kernel = count_kernel(arr.dtype, op) if _kernel_accepts(arr, val) else None
+    if kernel is not None:
+        return int(kernel(arr, val))
+    
+    return int(_NP_OPS[op](arr, val).sum())
+
+
+def _kernel_accepts(arr: np.ndarray, val: Any) -> bool:
+    """
+    Check whether a comparison is worth running in a compiled kernel.
+    
+    Numba only accepts integer values that fit in 64 bits, so larger
+    literals are compared by NumPy.
+    
+    Args:
+        arr: Numeric column array
+        val: Value compared against
+        
+    Returns:
+        True if the column is long enough and the value fits a kernel
+    """
+    
+    if len(arr) < KERNEL_MIN_ROWS:
+        return False
+    if isinstance(val, float):
+        return True
+    int64 = np.iinfo(np.int64)
+    return isinstance(val, int) and int64.min <= val <= int64.max
+
+
+def _categorical_mask(
+    column: CategoricalColumn,
+    op: str,
+    val: str
+) -> np.ndarray:
+    """
+    Evaluate a comparison on a dictionary-encoded column.
+    
+    Categories are sorted, so the value is located once with a binary
+    search and every operator becomes an integer comparison on the codes.
+    
+    Args:
+        column: Dictionary-encoded column
+        op: Comparison operator
+        val: String comparison value
+        
+    Returns:
+        Boolean mask of matching rows
+    """
+    
+    codes = column.codes
+    # Categories in [left, right) are equal to val (at most one)
+    left = int(np.searchsorted(column.categories, val, side='left'))
+    right = int(np.searchsorted(column.categories, val, side='right'))
+    
+    if op == '=':
+        if left == right:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == left
+    if op == '!=':
+        if left == right:
+            return np.ones(len(codes), dtype=bool)
+        return codes != left
+    if op == '<':
+        return codes < left
+    if op == '<=':
+        return codes < right
+    if op == '>':
+        return codes >= right
+    return codes >= left
+
+
+def _index_bounds(
+    col: str,
+    arr: np.ndarray,
+    op: str,
+    val: Any,
+    indexes: Optional[Dict[str, tuple[np.ndarray, np.ndarray]]]
+) -> Optional[tuple[np.ndarray, int, int]]:
+    """
+    Answer a range filter from a sorted index of the column.
+    
+    The index (row order and sorted values, NaN excluded) is built the
+    first time a large numeric column is range-filtered and kept in
+    indexes for later queries.
+    
+    Args:
+        col: Column name
+        arr: Column array
+        op: Comparison operator
+        val: Comparison value coerced to the column type
+        indexes: Cache of sorted column indexes, or None to disable
+        
+    Returns:
+        tuple: (row order, start, end) so that order[start:end] are the
+        matching row positions, or None if no index applies
+    """
+    
+    if (indexes is None or op not in _RANGE_OPS
+            or arr.dtype.kind not in 'iuf' or len(arr) <= INDEX_MIN_ROWS):
+        return None
+    
+    if col not in indexes:
+        order = np.argsort(arr, kind='stable')
+        if arr.dtype.kind == 'f':
+            # NaN sorts last and never matches a comparison
+            order = order[:len(arr) - int(np.isnan(arr).sum())]
+        indexes[col] = (order, arr[order])
+    
+    order, sorted_values = indexes[col]
+    
+    if op == '>':
+        lo, hi = np.searchsorted(sorted_values, val, side='right'), len(order)
+    elif op == '>=':
+        lo, hi = np.searchsorted(sorted_values, val, side='left'), len(order)
+    elif op == '<':
+        lo, hi = 0, np.searchsorted(sorted_values, val, side='left')
+    else:
+        lo, hi = 0, np.searchsorted(sorted_values, val, side='right')
+    
+    return order, int(lo), int(hi)
+
+
+def _resolve_where_columnar(
+    table: ColumnarTable,
+    where_clause: WhereClause
+) -> tuple[Union[np.ndarray, CategoricalColumn], str, Any]:
+    """
+    Validate a WHERE clause against a columnar table.
+    
+    Args:
+        table: Table to filter
+        where_clause: WhereClause
+        
+    Returns:
+        tuple: (column array, operator, comparison value coerced to the
+        column type)
+        
+    Raises:
+        ExecutionError: If column doesn't exist, the value cannot be
+            compared with the column or operator is unknown
+    """
+    
+    col = where_clause.col
+    op = where_clause.op
+    
+    if col not in table.columns:
+        raise ExecutionError(f"Column '{col}' not found in table.")
+    
+    if op not in _NP_OPS:
+        raise ExecutionError(f"Unknown operator: '{op}'")
+    
+    val = _coerce_literal(col, where_clause.val, table.schema[col])
+    
+    return table.columns[col], op, val
+
+
+def _coerce_literal(col: str, val: Any, col_type: type) -> Any:
+    """
+    Coerce a WHERE comparison value to the type of a column.
+    
+    Args:
+        col: Column name (used in error messages)
+        val: Value parsed from the query
+        col_type: Column type from the table schema (int, float or str)
+        
+    Returns:
+        Value that can be compared against the column array
+        
+    Raises:
+        ExecutionError: If the value cannot be compared with the column
+    """
+    
+    if col_type is str:
+        if not isinstance(val, str):
+            raise ExecutionError(
+                f"Cannot compare column '{col}' with value '{val}': "
+                "column is not numeric"
+            )
+        return val
+    
+    if isinstance(val, str):
+        # Quoted numbers follow the same grammar as the column values
+        try:
+            return parse_number(val)
+        except ValueError:
+            raise ExecutionError(
+                f"Cannot compare column '{col}' with value '{val}': "
+                f"Cannot convert '{val}' to number"
+            )
+    
+    return val
+
+
 def _coerce_value(row_val: Any, comparison_val: Any) -> Any:
     """
     Coerce row value to match the type of comparison value.
     
+    Only used for row-oriented (list of dictionaries) input; columnar
+    tables coerce the comparison value once with _coerce_literal.
+    
     Args:
         row_val: Value from the row
         comparison_val: Value to compare against
@@ -138,41 +551,104 @@ def _coerce_value(row_val: Any, comparison_val: Any) -> Any:
     return row_val
 
 
-def _compare(row_val: Any, op: str, comparison_val: Any) -> bool:
+def _count_with_where(
+    data: Union[ColumnarTable, List[Dict[str, Any]]],
+    where_clause: Optional[WhereClause],
+    aggregate: Aggregate,
+    indexes: Optional[Dict[str, tuple[np.ndarray, np.ndarray]]] = None
+) -> Dict[str, Any]:
     """
-    Compare two values based on operator.
+    Compute COUNT(*) or COUNT(column_name) over the rows matching a WHERE
+    clause without materializing the filtered rows.
     
     Args:
-        row_val: Value from the row
-        op: Comparison operator (=, !=, >, <, >=, <=)
-        comparison_val: Value to compare against
+        data: ColumnarTable or list of rows
+        where_clause: WhereClause or None
+        aggregate: Aggregate with function and column
+        indexes: Optional cache of sorted column indexes for a ColumnarTable
         
     Returns:
-        Boolean result of comparison
+        Dictionary with aggregation result
         
     Raises:
-        ExecutionError: If operator is unknown
+        ExecutionError: If a column doesn't exist or values can't be compared
     """
     
-    if op == '=':
-        return row_val == comparison_val
-    elif op == '!=':
-        return row_val != comparison_val
-    elif op == '>':
-        return row_val > comparison_val
-    elif op == '<':
-        return row_val < comparison_val
-    elif op == '>=':
-        return row_val >= comparison_val
-    elif op == '<=':
-        return row_val <= comparison_val
-    else:
-        raise ExecutionError(f"Unknown operator: '{op}'")
+    col = aggregate.column
+    key = f'COUNT({col})'
+    
+    if isinstance(data, ColumnarTable):
+        if col == '*':
+            if not where_clause:
+                return {key: len(data)}
+            return {key: _count_where_columnar(data, where_clause, indexes)}
+        
+        if col not in data.columns:
+            raise ExecutionError(f"Column '{col}' not found in table.")
+        
+        mask = _apply_where_columnar(data, where_clause, indexes)
+        counted = _notnull_mask(data.columns[col])
+        if mask is not None:
+            counted &= mask
+        return {key: int(counted.sum())}
+    
+    if col != '*' and data and col not in data[0]:
+        raise ExecutionError(f"Column '{col}' not found in table.")
+    
+    if where_clause:
+        where_col = where_clause.col
+        val = where_clause.val
+        if where_clause.op not in _OPS:
+            raise ExecutionError(f"Unknown operator: '{where_clause.op}'")
+        op_fn = _OPS[where_clause.op]
+        if data and where_col not in data[0]:
+            raise ExecutionError(f"Column '{where_col}' not found in table.")
+    
+    count = 0
+    for row in data:
+        if where_clause:
+            try:
+                row_val = _coerce_value(row[where_col], val)
+            except ValueError as e:
+                raise ExecutionError(
+                    f"Cannot compare column '{where_col}' with value '{val}': {e}"
+                )
+            
+            if not op_fn(row_val, val):
+                continue
+        
+        if col == '*' or (row[col] is not None and row[col] != ''):
+            count += 1
+    
+    return {key: count}
+
+
+def _notnull_mask(arr: Union[np.ndarray, CategoricalColumn]) -> np.ndarray:
+    """
+    Build a mask of the non-null values in a column.
+    
+    Missing values are NaN in float64 arrays (float columns, and integer
+    columns with missing values) and empty strings in text columns.
+    
+    Args:
+        arr: Column array or dictionary-encoded column
+        
+    Returns:
+        Boolean array that is True where the value is present
+    """
+    
+    if isinstance(arr, CategoricalColumn):
+        return _categorical_mask(arr, '!=', '')
+    if arr.dtype.kind == 'f':
+        return ~np.isnan(arr)
+    if arr.dtype.kind == 'O':
+        return np.not_equal(arr, '') & np.not_equal(arr, None)
+    return np.ones(len(arr), dtype=bool)
 
 
 def _apply_aggregation(
     data: List[Dict[str, Any]],
-    aggregate: Dict[str, str]
+    aggregate: Aggregate
 ) -> Dict[str, Any]:
     """
     Apply aggregation function to data.
@@ -181,7 +657,7 @@ def _apply_aggregation(
     
     Args:
         data: List of rows
-        aggregate: Dictionary with 'function' and 'column'
+        aggregate: Aggregate with function and column
         
     Returns:
         Dictionary with aggregation result
@@ -190,8 +666,8 @@ def _apply_aggregation(
         ExecutionError: If column doesn't exist or function is unknown
     """
     
-    func = aggregate['function'].upper()
-    col = aggregate['column']
+    func = aggregate.function.upper()
+    col = aggregate.column
     
     if func != 'COUNT':
         raise ExecutionError(f"Unsupported aggregate function: '{func}'")
@@ -204,20 +680,20 @@ def _apply_aggregation(
         if data and col not in data[0]:
             raise ExecutionError(f"Column '{col}' not found in table.")
         
-        count = sum(1 for row in data if col in row and row[col] is not None and row[col] != '')
+        count = sum(1 for row in data if row[col] is not None and row[col] != '')
         return {f'COUNT({col})': count}
 
 
 def _apply_projection(
     data: List[Dict[str, Any]],
-    select_cols: List[str]
+    select_cols: Tuple[str, ...]
 ) -> List[Dict[str, Any]]:
     """
     Project columns from rows.
     
     Args:
         data: List of rows
-        select_cols: List of column names or ['*']
+        select_cols: Tuple of column names or ('*',)
         
     Returns:
         List of rows with only selected columns
@@ -230,17 +706,78 @@ def _apply_projection(
         return []
     
     # SELECT *
-    if select_cols == ['*']:
+    if select_cols == ('*',):
         return data
     
     # SELECT specific columns
-    projected = []
-    for row in data:
-        projected_row = {}
-        for col in select_cols:
-            if col not in row:
-                raise ExecutionError(f"Column '{col}' not found in table.")
-            projected_row[col] = row[col]
-        projected.append(projected_row)
-    
-    return projected
+    missing = [col for col in select_cols if col not in data[0]]
+    if missing:
+        raise ExecutionError(f"Column(s) {_quote_names(missing)} not found in table.")
+    
+    if ENGINE_CORE_AVAILABLE and type(data) is list:
+        try:
+            return project_rows(data, tuple(select_cols))
+        except TypeError:
+            # Not every row is a dict, as the extension requires
+            pass
+    
+    getter = itemgetter(*select_cols)
+    if len(select_cols) == 1:
+        col = select_cols[0]
+        return [{col: getter(row)} for row in data]
+    
+    return [dict(zip(select_cols, getter(row))) for row in data]
+
+
+def _project_columnar(
+    table: ColumnarTable,
+    mask: Optional[np.ndarray],
+    select_cols: Tuple[str, ...]
+) -> ColumnarTable:
+    """
+    Project columns from a columnar table, keeping rows where mask is True.
+    
+    Without a mask the selected columns are shared with the source table
+    rather than copied.
+    
+    Args:
+        table: Source table
+        mask: Boolean mask of rows to keep, or None to keep all rows
+        select_cols: Tuple of column names or ('*',)
+        
+    Returns:
+        ColumnarTable with only the selected columns
+        
+    Raises:
+        ExecutionError: If column doesn't exist
+    """
+    
+    if select_cols == ('*',):
+        select_cols = table.column_names
+    
+    missing = [col for col in select_cols if col not in table.columns]
+    if missing:
+        raise ExecutionError(f"Column(s) {_quote_names(missing)} not found in table.")
+    
+    if mask is None:
+        columns = {col: table.columns[col] for col in select_cols}
+        row_count = len(table)
+    else:
+        columns = {col: table.columns[col][mask] for col in select_cols}
+        row_count = int(mask.sum())
+    
+    schema = {col: table.schema[col] for col in select_cols}
+    return ColumnarTable(columns, row_count, schema)
+
+
+def _quote_names(names: List[str]) -> str:
+    """
+    Format column names for an error message, e.g. 'a', 'b'.
+    
+    Args:
+        names: Column names
+        
+    Returns:
+        Comma-separated quoted names
+    """
+    return ', '.join(f"'{name}'" for name in names)
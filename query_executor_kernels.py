@@ -0,0 +1,174 @@
+"""
+Module with compiled WHERE kernels for numeric columns.
+
+The kernels are compiled with Numba when it is installed. Without Numba,
+filter_kernel() and count_kernel() return None and the executor uses
+NumPy comparisons instead.
+"""
+
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Columns shorter than this are filtered with NumPy, since compiling a
+# kernel on first use costs more than it saves on small tables
+KERNEL_MIN_ROWS = 100_000
+
+# Column dtypes the kernels are compiled for
+_KERNEL_DTYPES = (np.dtype(np.int64), np.dtype(np.float64))
+
+
+_FILTER_KERNELS = {}
+_COUNT_KERNELS = {}
+
+
+if NUMBA_AVAILABLE:
+    # fastmath is left off: it lets LLVM assume there are no NaNs, and
+    # NaN marks missing values in float columns.
+    _jit = njit(cache=True, parallel=True)
+    
+    @_jit
+    def filter_eq(arr, val):
+        mask = np.empty(arr.shape[0], dtype=np.bool_)
+        for i in prange(arr.shape[0]):
+            mask[i] = arr[i] == val
+        return mask
+    
+    @_jit
+    def filter_ne(arr, val):
+        mask = np.empty(arr.shape[0], dtype=np.bool_)
+        for i in prange(arr.shape[0]):
+            mask[i] = arr[i] != val
+        return mask
+    
+    @_jit
+    def filter_gt(arr, val):
+        mask = np.empty(arr.shape[0], dtype=np.bool_)
+        for i in prange(arr.shape[0]):
+            mask[i] = arr[i] > val
+        return mask
+    
+    @_jit
+    def filter_lt(arr, val):
+        mask = np.empty(arr.shape[0], dtype=np.bool_)
+        for i in prange(arr.shape[0]):
+            mask[i] = arr[i] < val
+        return mask
+    
+    @_jit
+    def filter_ge(arr, val):
+        mask = np.empty(arr.shape[0], dtype=np.bool_)
+        for i in prange(arr.shape[0]):
+            mask[i] = arr[i] >= val
+        return mask
+    
+    @_jit
+    def filter_le(arr, val):
+        mask = np.empty(arr.shape[0], dtype=np.bool_)
+        for i in prange(arr.shape[0]):
+            mask[i] = arr[i] <= val
+        return mask
+    
+    @_jit
+    def count_eq(arr, val):
+        total = 0
+        for i in prange(arr.shape[0]):
+            if arr[i] == val:
+                total += 1
+        return total
+    
+    @_jit
+    def count_ne(arr, val):
+        total = 0
+        for i in prange(arr.shape[0]):
+            if arr[i] != val:
+                total += 1
+        return total
+    
+    @_jit
+    def count_gt(arr, val):
+        total = 0
+        for i in prange(arr.shape[0]):
+            if arr[i] > val:
+                total += 1
+        return total
+    
+    @_jit
+    def count_lt(arr, val):
+        total = 0
+        for i in prange(arr.shape[0]):
+            if arr[i] < val:
+                total += 1
+        return total
+    
+    @_jit
+    def count_ge(arr, val):
+        total = 0
+        for i in prange(arr.shape[0]):
+            if arr[i] >= val:
+                total += 1
+        return total
+    
+    @_jit
+    def count_le(arr, val):
+        total = 0
+        for i in prange(arr.shape[0]):
+            if arr[i] <= val:
+                total += 1
+        return total
+    
+    # Numba specializes each kernel per argument type on first call, so the
+    # same function serves every supported dtype
+    for _dtype in _KERNEL_DTYPES:
+        _FILTER_KERNELS.update({
+            (_dtype, '='): filter_eq,
+            (_dtype, '!='): filter_ne,
+            (_dtype, '>'): filter_gt,
+            (_dtype, '<'): filter_lt,
+            (_dtype, '>='): filter_ge,
+            (_dtype, '<='): filter_le,
+        })
+        _COUNT_KERNELS.update({
+            (_dtype, '='): count_eq,
+            (_dtype, '!='): count_ne,
+            (_dtype, '>'): count_gt,
+            (_dtype, '<'): count_lt,
+            (_dtype, '>='): count_ge,
+            (_dtype, '<='): count_le,
+        })
+
+
+def filter_kernel(dtype: np.dtype, op: str) -> Optional[Callable]:
+    """
+    Look up the compiled filter kernel for a column dtype and operator.
+    
+    Args:
+        dtype: Column dtype
+        op: Comparison operator (=, !=, >, <, >=, <=)
+        
+    Returns:
+        Function (arr, val) -> boolean mask, or None if no kernel applies
+    """
+    return _FILTER_KERNELS.get((dtype, op))
+
+
+def count_kernel(dtype: np.dtype, op: str) -> Optional[Callable]:
+    """
+    Look up the compiled count kernel for a column dtype and operator.
+    
+    Args:
+        dtype: Column dtype
+        op: Comparison operator (=, !=, >, <, >=, <=)
+        
+    Returns:
+        Function (arr, val) -> number of matching values, or None if no
+        kernel applies
+    """
+    return _COUNT_KERNELS.get((dtype, op))
@@ -0,0 +1,15 @@
+"""
+Build script for the optional compiled row-mode kernels.
+
+Build in place with:
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+
+setup(
+    name='mini-sql-database-engine',
+    ext_modules=cythonize(["_engine_core.pyx"]),
+)
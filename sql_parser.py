@@ -3,7 +3,22 @@ Module for parsing SQL queries.
 """
 
 import re
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, Tuple
+
+
+# Patterns compiled once at import time
+_SELECT_RE = re.compile(
+    r'SELECT\s+(.*?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+))?',
+    re.IGNORECASE | re.DOTALL
+)
+_COUNT_RE = re.compile(r'COUNT\s*\(\s*(\*|\w+)\s*\)', re.IGNORECASE)
+# Operators are listed longest first so '=' never shadows '>=', '<=' or '!='
+_WHERE_RE = re.compile(r'(\w+)\s*(!=|>=|<=|=|>|<)\s*(.+)')
+_IDENT_RE = re.compile(r'^\w+$')
+
+# Number of distinct query strings whose parse result is cached
+PARSE_CACHE_SIZE = 256
 
 
 class QueryParseError(Exception):
@@ -11,10 +26,35 @@ class QueryParseError(Exception):
     pass
 
 
-def parse_query(query: str) -> Dict[str, Any]:
+class WhereClause(NamedTuple):
+    """A WHERE condition: column operator value."""
+    col: str
+    op: str
+    val: Any
+
+
+class Aggregate(NamedTuple):
+    """An aggregate function call such as COUNT(*)."""
+    function: str
+    column: str
+
+
+class ParsedQuery(NamedTuple):
+    """Components of a parsed SELECT query."""
+    select_cols: Tuple[str, ...]
+    from_table: str
+    where_clause: Optional[WhereClause]
+    aggregate: Optional[Aggregate]
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_query(query: str) -> ParsedQuery:
     """
     Parse a SQL query into its components.
     
+    Results are cached per query string; they are immutable, so the same
+    ParsedQuery can be shared between callers.
+    
     Supported syntax:
         SELECT column1, column2, ... | * FROM table_name [WHERE condition]
         
@@ -22,11 +62,11 @@ def parse_query(query: str) -> Dict[str, Any]:
         query: Raw SQL query string
         
     Returns:
-        Dictionary with keys:
-            - 'select_cols': list of column names or ['*']
-            - 'from_table': table name (or derived from CSV filename)
-            - 'where_clause': dict with 'col', 'op', 'val' or None
-            - 'aggregate': dict with 'function', 'column' or None
+        ParsedQuery with fields:
+            - select_cols: tuple of column names or ('*',)
+            - from_table: table name (or derived from CSV filename)
+            - where_clause: WhereClause with col, op, val or None
+            - aggregate: Aggregate with function, column or None
             
     Raises:
         QueryParseError: If the query syntax is invalid
@@ -39,8 +79,7 @@ def parse_query(query: str) -> Dict[str, Any]:
     
     # Use regex to identify main clauses
     # Pattern: SELECT ... FROM ... [WHERE ...]
-    select_pattern = r'SELECT\s+(.*?)\s+FROM\s+([\w]+)(?:\s+WHERE\s+(.+))?'
-    match = re.match(select_pattern, query, re.IGNORECASE)
+    match = _SELECT_RE.match(query)
     
     if not match:
         raise QueryParseError(
@@ -59,15 +98,10 @@ def parse_query(query: str) -> Dict[str, Any]:
     if where_part:
         where_clause = _parse_where_clause(where_part)
     
-    return {
-        'select_cols': select_cols,
-        'from_table': from_table,
-        'where_clause': where_clause,
-        'aggregate': aggregate
-    }
+    return ParsedQuery(select_cols, from_table, where_clause, aggregate)
 
 
-def _parse_select_clause(select_part: str) -> tuple[List[str], Optional[Dict[str, str]]]:
+def _parse_select_clause(select_part: str) -> tuple[Tuple[str, ...], Optional[Aggregate]]:
     """
     Parse the SELECT clause.
     
@@ -82,7 +116,7 @@ def _parse_select_clause(select_part: str) -> tuple[List[str], Optional[Dict[str
         select_part: The SELECT clause content
         
     Returns:
-        tuple: (list of column names, aggregate dict or None)
+        tuple: (tuple of column names, Aggregate or None)
         
     Raises:
         QueryParseError: If syntax is invalid
@@ -91,29 +125,28 @@ def _parse_select_clause(select_part: str) -> tuple[List[str], Optional[Dict[str
     select_part = select_part.strip()
     
     # Check for aggregate functions
-    count_pattern = r'COUNT\s*\(\s*(\*|[\w]+)\s*\)'
-    count_match = re.match(count_pattern, select_part, re.IGNORECASE)
+    count_match = _COUNT_RE.match(select_part)
     
     if count_match:
         column = count_match.group(1).strip()
-        return ['*'], {'function': 'COUNT', 'column': column}
+        return ('*',), Aggregate('COUNT', column)
     
     # Check for SELECT *
     if select_part == '*':
-        return ['*'], None
+        return ('*',), None
     
     # Parse individual columns
-    columns = [col.strip() for col in select_part.split(',')]
+    columns = tuple(col.strip() for col in select_part.split(','))
     
     # Validate column names (alphanumeric and underscore)
     for col in columns:
-        if not re.match(r'^[\w]+$', col):
+        if not _IDENT_RE.match(col):
             raise QueryParseError(f"Invalid column name: '{col}'")
     
     return columns, None
 
 
-def _parse_where_clause(where_part: str) -> Dict[str, Any]:
+def _parse_where_clause(where_part: str) -> WhereClause:
     """
     Parse the WHERE clause.
     
@@ -131,7 +164,7 @@ def _parse_where_clause(where_part: str) -> Dict[str, Any]:
         where_part: The WHERE clause content
         
     Returns:
-        Dictionary with keys: 'col', 'op', 'val'
+        WhereClause with col, op and val
         
     Raises:
         QueryParseError: If syntax is invalid
@@ -141,8 +174,7 @@ def _parse_where_clause(where_part: str) -> Dict[str, Any]:
     
     # Pattern for WHERE clause: column operator value
     # Operators: =, !=, >=, <=, >, <
-    pattern = r"([\w]+)\s*(=|!=|>=|<=|>|<)\s*(.+)"
-    match = re.match(pattern, where_part)
+    match = _WHERE_RE.match(where_part)
     
     if not match:
         raise QueryParseError(
@@ -156,11 +188,7 @@ def _parse_where_clause(where_part: str) -> Dict[str, Any]:
     # Parse the value (string or number)
     parsed_val = _parse_value(val)
     
-    return {
-        'col': col,
-        'op': op,
-        'val': parsed_val
-    }
+    return WhereClause(col, op, parsed_val)
 
 
 def _parse_value(val_str: str) -> Any:
@@ -3,9 +3,23 @@ Test script for the SQL query engine.
 Demonstrates all features without requiring interactive input.
 """
 
-from data_loader import load_csv
+import csv
+import json
+import os
+import random
+import tempfile
+from collections import UserDict
+from pathlib import Path
+
+import numpy as np
+
+import data_loader
+import query_executor
+import query_executor_kernels
+from data_loader import load_csv, ColumnarTable
 from sql_parser import parse_query
-from query_executor import execute_query
+from query_executor import execute_query, ExecutionError
+from main import SQLEngine
 from tabulate import tabulate
 
 
@@ -24,7 +38,7 @@ def test_sql_engine():
         print(f"[OK] Successfully loaded CSV file")
         print(f"  Table name: {table_name}")
         print(f"  Rows: {len(data)}")
-        print(f"  Columns: {list(data[0].keys())}")
+        print(f"  Columns: {data.column_names}")
     except Exception as e:
         print(f"[ERROR] Failed: {e}")
         return
@@ -110,6 +124,8 @@ def test_sql_engine():
             
             # Display results
             if result:
+                if isinstance(result, ColumnarTable):
+                    result = result.to_rows()
                 print(tabulate(result, headers='keys', tablefmt='simple'))
                 print(f"[OK] Rows returned: {len(result)}")
             else:
@@ -129,6 +145,635 @@ def test_sql_engine():
     print("="*70 + "\n")
 
 
+def test_where_operators():
+    """Test that multi-character WHERE operators are tokenized correctly."""
+    
+    print("\n" + "="*70)
+    print("WHERE Operator Parsing Tests")
+    print("="*70 + "\n")
+    
+    operator_tests = [
+        {'where': 'age >= 30', 'expected': ('age', '>=', 30)},
+        {'where': 'age <= 30', 'expected': ('age', '<=', 30)},
+        {'where': 'age != 30', 'expected': ('age', '!=', 30)},
+        {'where': 'age>=30', 'expected': ('age', '>=', 30)},
+        {'where': "country = 'USA'", 'expected': ('country', '=', 'USA')},
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for i, test in enumerate(operator_tests, 1):
+        query = f"SELECT * FROM sample_data WHERE {test['where']}"
+        print(f"OPERATOR TEST {i}: {test['where']}")
+        
+        try:
+            where = parse_query(query).where_clause
+            actual = (where.col, where.op, where.val)
+            if actual == test['expected']:
+                print(f"  [OK] Parsed as {actual}")
+                passed += 1
+            else:
+                print(f"  [ERROR] Expected {test['expected']}, got {actual}")
+                failed += 1
+        except Exception as e:
+            print(f"  [ERROR] Error: {e}")
+            failed += 1
+        
+        print()
+    
+    # Summary
+    print("="*70)
+    print(f"Operator Parsing Summary: {passed} passed, {failed} failed out of {len(operator_tests)} tests")
+    print("="*70 + "\n")
+
+
+def test_large_table():
+    """Test that columnar fast paths agree with row-by-row execution."""
+    
+    print("\n" + "="*70)
+    print("Large Table Consistency Tests")
+    print("="*70 + "\n")
+    
+    # Generate a table big enough to use sorted indexes and to
+    # dictionary-encode the country column
+    rng = random.Random(0)
+    countries = ['USA', 'UK', 'Canada', 'India', 'Germany']
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'large_data.csv')
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'age', 'country', 'salary'])
+            for i in range(20000):
+                writer.writerow([
+                    i,
+                    rng.randint(18, 70),
+                    rng.choice(countries),
+                    round(rng.uniform(30000, 120000), 2),
+                ])
+        data, table_name = load_csv(file_path)
+    
+    rows = data.to_rows()
+    indexes = {}
+    
+    queries = [
+        'SELECT COUNT(*) FROM large_data WHERE age > 40',
+        'SELECT COUNT(*) FROM large_data WHERE age <= 25',
+        'SELECT COUNT(*) FROM large_data WHERE salary >= 75000.5',
+        'SELECT COUNT(salary) FROM large_data WHERE age < 30',
+        'SELECT id, age FROM large_data WHERE age >= 65',
+        'SELECT id FROM large_data WHERE salary < 31000',
+        "SELECT id FROM large_data WHERE country = 'India'",
+        "SELECT COUNT(*) FROM large_data WHERE country != 'USA'",
+        "SELECT id FROM large_data WHERE country > 'India'",
+        "SELECT COUNT(*) FROM large_data WHERE country <= 'Germany'",
+        "SELECT COUNT(country) FROM large_data WHERE country = 'France'",
+        "SELECT country FROM large_data WHERE country != 'France'",
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for i, query in enumerate(queries, 1):
+        print(f"LARGE TABLE TEST {i}: {query}")
+        
+        try:
+            parsed = parse_query(query)
+            expected = execute_query(rows, parsed)
+            results = [
+                execute_query(data, parsed),
+                execute_query(data, parsed, indexes),
+            ]
+            results = [
+                r.to_rows() if isinstance(r, ColumnarTable) else r
+                for r in results
+            ]
+            if all(r == expected for r in results):
+                print(f"  [OK] {len(expected)} rows match")
+                passed += 1
+            else:
+                print("  [ERROR] Columnar result differs from row-by-row result")
+                failed += 1
+        except Exception as e:
+            print(f"  [ERROR] Error: {e}")
+            failed += 1
+        
+        print()
+    
+    # Summary
+    print("="*70)
+    print(f"Large Table Summary: {passed} passed, {failed} failed out of {len(queries)} tests")
+    print("="*70 + "\n")
+
+
+def test_kernels():
+    """Test that compiled WHERE kernels agree with NumPy comparisons."""
+    
+    print("\n" + "="*70)
+    print("Compiled Kernel Tests")
+    print("="*70 + "\n")
+    
+    if not query_executor_kernels.NUMBA_AVAILABLE:
+        print("[SKIP] Numba is not installed")
+        print()
+        return
+    
+    rng = np.random.default_rng(3)
+    row_count = 2000
+    floats = rng.uniform(0, 100, row_count)
+    floats[::10] = np.nan
+    data = ColumnarTable(
+        {
+            'id': np.arange(row_count, dtype=np.int64),
+            'age': rng.integers(18, 70, row_count).astype(np.int64),
+            'score': floats,
+        },
+        row_count,
+        {'id': int, 'age': int, 'score': float},
+    )
+    
+    # Integer and float literals on int and float (NaN) columns
+    conditions = [
+        f'{col} {op} {val}'
+        for col, val in (('age', '40'), ('age', '40.5'), ('score', '50.25'), ('score', '50'))
+        for op in ('=', '!=', '>', '<', '>=', '<=')
+    ]
+    conditions.append('score = 0')
+    # Integers beyond 64 bits cannot be passed to a kernel
+    conditions += ['age < 99999999999999999999', 'score < 99999999999999999999']
+    
+    passed = 0
+    failed = 0
+    
+    original = query_executor.KERNEL_MIN_ROWS
+    for i, condition in enumerate(conditions, 1):
+        print(f"KERNEL TEST {i}: {condition}")
+        
+        try:
+            results = []
+            for min_rows in (0, row_count + 1):
+                # 0 sends every column through the kernels
+                query_executor.KERNEL_MIN_ROWS = min_rows
+                select = execute_query(data, parse_query(f'SELECT id FROM t WHERE {condition}'))
+                count = execute_query(data, parse_query(f'SELECT COUNT(*) FROM t WHERE {condition}'))
+                results.append((select.columns['id'].tolist(), count))
+            if results[0] == results[1]:
+                print(f"  [OK] {len(results[0][0])} rows match")
+                passed += 1
+            else:
+                print("  [ERROR] Kernel result differs from NumPy result")
+                failed += 1
+        except Exception as e:
+            print(f"  [ERROR] Error: {e}")
+            failed += 1
+        finally:
+            query_executor.KERNEL_MIN_ROWS = original
+        
+        print()
+    
+    # Summary
+    print("="*70)
+    print(f"Kernel Summary: {passed} passed, {failed} failed out of {len(conditions)} tests")
+    print("="*70 + "\n")
+
+
+def test_engine_core():
+    """Test that the compiled row filter and projection agree with the Python loops."""
+    
+    print("\n" + "="*70)
+    print("Compiled Row Function Tests")
+    print("="*70 + "\n")
+    
+    if not query_executor.ENGINE_CORE_AVAILABLE:
+        print("[SKIP] _engine_core is not built (python setup.py build_ext --inplace)")
+        print()
+        return
+    
+    data, _ = load_csv('sample_data.csv')
+    rows = data.to_rows()
+    
+    # Plain dict rows use the extension; other mappings fall back to Python
+    datasets = {
+        'dict rows': rows,
+        'mapping rows': [UserDict(row) for row in rows],
+    }
+    queries = [
+        "SELECT name, age FROM t WHERE age > 30",
+        "SELECT * FROM t WHERE country = 'USA'",
+        "SELECT age FROM t WHERE age = '32'",
+        "SELECT name, salary FROM t WHERE salary <= 60000.5",
+        "SELECT name FROM t WHERE department != 'Engineering'",
+        "SELECT name FROM t WHERE name > 5",
+    ]
+    
+    passed = 0
+    failed = 0
+    test_id = 0
+    
+    original = query_executor.ENGINE_CORE_AVAILABLE
+    for label, dataset in datasets.items():
+        for query in queries:
+            test_id += 1
+            print(f"ROW FUNCTION TEST {test_id}: {query} ({label})")
+            
+            results = []
+            try:
+                for available in (True, False):
+                    query_executor.ENGINE_CORE_AVAILABLE = available
+                    try:
+                        result = execute_query(dataset, parse_query(query))
+                        result = [dict(row) for row in result]
+                    except ExecutionError as e:
+                        result = f"ExecutionError: {e}"
+                    results.append(result)
+            except Exception as e:
+                results = [f"{type(e).__name__}: {e}", None]
+            finally:
+                query_executor.ENGINE_CORE_AVAILABLE = original
+            
+            if results[0] == results[1]:
+                shown = results[0] if isinstance(results[0], str) else f"{len(results[0])} rows match"
+                print(f"  [OK] {shown}")
+                passed += 1
+            else:
+                print(f"  [ERROR] Extension gives {results[0]}, Python gives {results[1]}")
+                failed += 1
+            
+            print()
+    
+    # Summary
+    print("="*70)
+    print(f"Row Function Summary: {passed} passed, {failed} failed out of {test_id} tests")
+    print("="*70 + "\n")
+
+
+def test_single_query():
+    """Test that pushing a query into loading gives the same result."""
+    
+    print("\n" + "="*70)
+    print("Single Query (Pushdown) Tests")
+    print("="*70 + "\n")
+    
+    data, table_name = load_csv('sample_data.csv')
+    engine = SQLEngine()
+    
+    queries = [
+        "SELECT name, age FROM sample_data WHERE age > 30",
+        "SELECT * FROM sample_data WHERE country = 'USA'",
+        "SELECT age FROM sample_data WHERE age = '32'",
+        "SELECT age, age FROM sample_data WHERE age >= 33",
+        "SELECT name, salary FROM sample_data",
+        "SELECT COUNT(*) FROM sample_data WHERE salary <= 60000",
+        "SELECT COUNT(age) FROM sample_data WHERE age = '32'",
+        "SELECT COUNT(name) FROM sample_data WHERE department != 'Engineering'",
+        "SELECT COUNT(*) FROM sample_data WHERE age > 1000",
+        "SELECT COUNT(*) FROM sample_data WHERE age > 'abc'",
+        "SELECT name FROM sample_data WHERE country < 5",
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for i, query in enumerate(queries, 1):
+        print(f"SINGLE QUERY TEST {i}: {query}")
+        
+        try:
+            parsed = parse_query(query)
+            results = []
+            for run in (lambda: execute_query(data, parsed),
+                        lambda: engine.query_file(parsed, 'sample_data.csv')):
+                # Both ways of running the query must raise the same error
+                try:
+                    result = run()
+                except ExecutionError as e:
+                    result = f"ExecutionError: {e}"
+                if isinstance(result, ColumnarTable):
+                    result = result.to_rows()
+                results.append(result)
+            if results[0] == results[1]:
+                if isinstance(results[0], str):
+                    print(f"  [OK] Both raise {results[0]}")
+                else:
+                    print(f"  [OK] {len(results[0])} rows match")
+                passed += 1
+            else:
+                print("  [ERROR] Pushdown result differs from loaded-table result")
+                failed += 1
+        except Exception as e:
+            print(f"  [ERROR] Error: {e}")
+            failed += 1
+        
+        print()
+    
+    # Summary
+    print("="*70)
+    print(f"Single Query Summary: {passed} passed, {failed} failed out of {len(queries)} tests")
+    print("="*70 + "\n")
+
+
+def test_cache():
+    """Test that the on-disk cache returns the loaded table until the CSV changes."""
+    
+    print("\n" + "="*70)
+    print("On-Disk Cache Tests")
+    print("="*70 + "\n")
+    
+    rng = random.Random(1)
+    passed = 0
+    failed = 0
+    
+    def check(name, ok):
+        nonlocal passed, failed
+        print(f"CACHE TEST {passed + failed + 1}: {name}")
+        if ok:
+            print("  [OK]")
+            passed += 1
+        else:
+            print("  [ERROR] Check failed")
+            failed += 1
+        print()
+    
+    original = data_loader.CACHE_MIN_BYTES
+    data_loader.CACHE_MIN_BYTES = 0
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, 'cached.csv')
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['id', 'score', 'city', 'note'])
+                for i in range(2000):
+                    writer.writerow([
+                        i,
+                        '' if i % 7 == 0 else rng.uniform(0, 100),
+                        rng.choice(['Oslo', 'Köln', 'Zürich']),
+                        '' if i % 5 == 0 else 'é' * rng.randint(1, 50) + str(i),
+                    ])
+            path = Path(file_path)
+            
+            expected, _ = load_csv(file_path)
+            written, _ = load_csv(file_path, use_cache=True)
+            check("First load writes the cache",
+                  data_loader._read_cache(path) is not None)
+            
+            cached, _ = load_csv(file_path, use_cache=True)
+            check("Cached table matches the CSV",
+                  cached.schema == expected.schema
+                  and cached.to_rows() == expected.to_rows() == written.to_rows())
+            check("Low-cardinality text stays dictionary-encoded",
+                  isinstance(cached.columns['city'], data_loader.CategoricalColumn))
+            
+            with open(file_path, 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerow([2000, 1.5, 'Oslo', 'new'])
+            check("Changing the CSV invalidates the cache",
+                  data_loader._read_cache(path) is None)
+            
+            reloaded, _ = load_csv(file_path, use_cache=True)
+            check("Changed CSV is reloaded",
+                  len(reloaded) == 2001 and reloaded.to_rows()[-1]['note'] == 'new')
+            
+            meta_path = path.with_name(path.name + data_loader.CACHE_SUFFIX) / 'meta.json'
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            del meta['row_count']
+            for label, damaged in (("list", []), ("missing row_count", meta)):
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    json.dump(damaged, f)
+                check(f"Damaged metadata ({label}) is ignored",
+                      data_loader._read_cache(path) is None
+                      and len(load_csv(file_path, use_cache=True)[0]) == 2001)
+    finally:
+        data_loader.CACHE_MIN_BYTES = original
+    
+    # Summary
+    print("="*70)
+    print(f"Cache Summary: {passed} passed, {failed} failed out of {passed + failed} tests")
+    print("="*70 + "\n")
+
+
+def test_parallel_load():
+    """Test that load_csv_parallel returns the same table as load_csv."""
+    
+    print("\n" + "="*70)
+    print("Parallel Loading Tests")
+    print("="*70 + "\n")
+    
+    rng = random.Random(2)
+    rows = []
+    for i in range(3000):
+        late = i >= 2000
+        rows.append([
+            i,
+            # int in the early chunks, float in the last one
+            f'{i}.5' if late else i,
+            # empty in the early chunks only
+            rng.randint(1, 9) if late else '',
+            # int everywhere, missing once in the last chunk
+            '' if i == 2500 else i,
+            rng.choice(['USA', 'UK', 'India']),
+            f'note {rng.randint(0, 10**6)}',
+        ])
+    
+    files = {
+        'mixed_types.csv': [['id', 'mixed', 'late', 'gaps', 'country', 'note']] + rows,
+        'quoted_newline.csv': [['a', 'b'], [1, 'x\ny'], [2, 'p'], [3, 'q']],
+    }
+    
+    passed = 0
+    failed = 0
+    
+    original = data_loader.PARALLEL_MIN_BYTES
+    data_loader.PARALLEL_MIN_BYTES = 0
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i, (name, file_rows) in enumerate(files.items(), 1):
+                print(f"PARALLEL TEST {i}: {name}")
+                file_path = os.path.join(tmp_dir, name)
+                with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerows(file_rows)
+                
+                try:
+                    expected, _ = load_csv(file_path)
+                    actual, _ = data_loader.load_csv_parallel(file_path, n_workers=3)
+                    # Without pyarrow, load_csv itself splits the file
+                    pyarrow_available = data_loader.PYARROW_AVAILABLE
+                    data_loader.PYARROW_AVAILABLE = False
+                    try:
+                        fallback, _ = load_csv(file_path)
+                    finally:
+                        data_loader.PYARROW_AVAILABLE = pyarrow_available
+                    if all(table.schema == expected.schema
+                           and table.to_rows() == expected.to_rows()
+                           for table in (actual, fallback)):
+                        print(f"  [OK] {len(actual)} rows match")
+                        passed += 1
+                    else:
+                        print("  [ERROR] Parallel result differs from load_csv")
+                        failed += 1
+                except Exception as e:
+                    print(f"  [ERROR] Error: {e}")
+                    failed += 1
+                
+                print()
+    finally:
+        data_loader.PARALLEL_MIN_BYTES = original
+    
+    # Summary
+    print("="*70)
+    print(f"Parallel Loading Summary: {passed} passed, {failed} failed out of {len(files)} tests")
+    print("="*70 + "\n")
+
+
+def test_type_inference():
+    """Test that column types never change how values are displayed."""
+    
+    print("\n" + "="*70)
+    print("Type Inference Tests")
+    print("="*70 + "\n")
+    
+    # Leading zeros make a column text; canonical numbers stay numeric
+    columns = {
+        'zip': (['007', '010', '123'], str),
+        'code': (['-0', '5', '6'], str),
+        'id': (['7', '10', '-3'], int),
+        'score': (['1.5', '', '2'], float),
+        'count': (['1234567', '', '89'], int),
+    }
+    
+    passed = 0
+    failed = 0
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'typed.csv')
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(list(columns))
+            writer.writerows(zip(*(values for values, _ in columns.values())))
+        data, table_name = load_csv(file_path)
+    
+    for i, (name, (values, expected)) in enumerate(columns.items(), 1):
+        print(f"TYPE TEST {i}: {name} = {values}")
+        actual = data.schema[name]
+        shown = [row[name] for row in data.to_rows()]
+        if actual is not expected:
+            print(f"  [ERROR] Expected {expected.__name__}, got {actual.__name__}")
+            failed += 1
+        elif expected is str and shown != values:
+            print(f"  [ERROR] Values changed to {shown}")
+            failed += 1
+        elif expected is int and [str(v) if v is not None else '' for v in shown] != values:
+            print(f"  [ERROR] Values changed to {shown}")
+            failed += 1
+        else:
+            print(f"  [OK] Loaded as {actual.__name__}: {shown}")
+            passed += 1
+        
+        print()
+    
+    # Summary
+    print("="*70)
+    print(f"Type Inference Summary: {passed} passed, {failed} failed out of {len(columns)} tests")
+    print("="*70 + "\n")
+
+
+def test_reader_parity():
+    """Test that pyarrow and the csv module give the same table."""
+    
+    print("\n" + "="*70)
+    print("CSV Reader Parity Tests")
+    print("="*70 + "\n")
+    
+    # Values Python's int()/float() accept but pyarrow does not, and the
+    # other way round
+    columns = {
+        'plain_int': ['1', '-2', '30'],
+        'blank_int': ['1', '', '3'],
+        'spaced': [' 42 ', '7', '8'],
+        'underscored': ['1_000', '2', '3'],
+        'special': ['nan', 'inf', '1.5'],
+        'hex': ['0x10', '1', '2'],
+        'signed': ['+5', '6', '-7'],
+        'zero_padded': ['007', '010', '123'],
+        'exponent': ['1e5', '.5', '5.'],
+        'huge': ['99999999999999999999', '1', '2'],
+        'text': ['a', 'b', ''],
+        'empty': ['', '', ''],
+    }
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'parity.csv')
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(list(columns))
+            writer.writerows(zip(*columns.values()))
+        
+        tables = {}
+        original = data_loader.PYARROW_AVAILABLE
+        try:
+            for use_pyarrow in (True, False):
+                data_loader.PYARROW_AVAILABLE = original and use_pyarrow
+                tables[use_pyarrow], _ = load_csv(file_path)
+        finally:
+            data_loader.PYARROW_AVAILABLE = original
+    
+    passed = 0
+    failed = 0
+    
+    for i, name in enumerate(columns, 1):
+        print(f"PARITY TEST {i}: {name} = {columns[name]}")
+        types = [tables[flag].schema[name] for flag in (True, False)]
+        values = [[row[name] for row in tables[flag].to_rows()] for flag in (True, False)]
+        if types[0] is types[1] and values[0] == values[1]:
+            print(f"  [OK] Both readers give {types[0].__name__}: {values[0]}")
+            passed += 1
+        else:
+            print(f"  [ERROR] pyarrow gives {types[0].__name__} {values[0]}, "
+                  f"csv gives {types[1].__name__} {values[1]}")
+            failed += 1
+        
+        print()
+    
+    # Whole files whose header needs care
+    files = [
+        ("byte order mark", '\ufeffid,name\n1,a\n2,b\n'),
+        ("duplicate header", 'a,a,b\n1,2,3\n4,5,6\n'),
+    ]
+    
+    for i, (label, content) in enumerate(files, len(columns) + 1):
+        print(f"PARITY TEST {i}: {label}")
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                file_path = os.path.join(tmp_dir, 'header.csv')
+                with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                    f.write(content)
+                
+                results = []
+                try:
+                    for use_pyarrow in (True, False):
+                        data_loader.PYARROW_AVAILABLE = original and use_pyarrow
+                        table, _ = load_csv(file_path)
+                        results.append((table.schema, table.to_rows()))
+                finally:
+                    data_loader.PYARROW_AVAILABLE = original
+            
+            if results[0] == results[1]:
+                print(f"  [OK] Both readers give {results[0][1]}")
+                passed += 1
+            else:
+                print(f"  [ERROR] pyarrow gives {results[0][1]}, csv gives {results[1][1]}")
+                failed += 1
+        except Exception as e:
+            print(f"  [ERROR] {e}")
+            failed += 1
+        
+        print()
+    
+    # Summary
+    total = len(columns) + len(files)
+    print("="*70)
+    print(f"Reader Parity Summary: {passed} passed, {failed} failed out of {total} tests")
+    print("="*70 + "\n")
+
+
 def test_error_handling():
     """Test error handling."""
     
@@ -165,6 +810,10 @@ def test_error_handling():
             'name': 'Invalid comparison operator',
             'query': "SELECT * FROM sample_data WHERE name <=> 'Alice'"
         },
+        {
+            'name': 'Quoted value that is not a number in a numeric column',
+            'query': "SELECT * FROM sample_data WHERE age = ' 32 '"
+        },
     ]
     
     handled = 0
@@ -200,6 +849,15 @@ def test_error_handling():
 
 if __name__ == '__main__':
     test_sql_engine()
+    test_where_operators()
+    test_large_table()
+    test_kernels()
+    test_engine_core()
+    test_single_query()
+    test_cache()
+    test_parallel_load()
+    test_type_inference()
+    test_reader_parity()
     test_error_handling()
     
     print("="*70)